@@ -0,0 +1,170 @@
+"""
+Compiled kernels for numerical hot paths, which are only available when the optional dependency
+Numba is installed. Each kernel is either a Numba-compiled function, or None when Numba is not
+available, in which case the corresponding NumPy implementation should be used instead.
+
+Kernels are compiled lazily on their first call, and cached on disk by Numba, so that the
+compilation cost (about 0.5-1.5 s per kernel) is only paid once per installation.
+Compilation can be made faster, at the cost of slightly slower kernels,
+by lowering Numba's optimization level, i.e. setting the environment variable `NUMBA_OPT=1`.
+"""
+
+# Standard library
+from typing import Callable, Optional, Tuple
+
+# 3rd-party
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+__all__ = (
+    "numba_available",
+    "shortest_composition",
+    "affine_transform",
+    "conversion_coefficients",
+)
+
+
+numba_available: bool = njit is not None
+
+
+def _compile(func: Callable = None, **options) -> Optional[Callable]:
+    """
+    Compile a kernel with Numba if it is available; otherwise return None.
+    When used with keyword arguments, these are passed to `numba.njit` as compilation options.
+    """
+    if func is None:
+        return lambda func_: _compile(func_, **options)
+    options = {"cache": True, "boundscheck": False, "error_model": "numpy"} | options
+    return njit(**options)(func) if numba_available else None
+
+
+@_compile
+def shortest_composition(
+    prim_dim_exps: np.ndarray, db_prim_exps: np.ndarray, max_iter: int
+) -> np.ndarray:
+    """
+    Greedy search for the shortest composition of known dimensions with a given primary
+    dimension decomposition; see `Dimension.equiv_dim_shortest_composition`.
+
+    Parameters
+    ----------
+    prim_dim_exps : numpy.ndarray
+        1D-array of exponents of the primary dimension decomposition to compose.
+    db_prim_exps : numpy.ndarray
+        2D-array of exponents of the primary dimension decomposition of each known dimension.
+    max_iter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+        numpy.ndarray
+        1D-array of exponents of each known dimension in the composition.
+    """
+    num_dims, num_prim_dims = db_prim_exps.shape
+    new_dim_dec = np.zeros(num_dims)
+    current_prim_dim_dec = prim_dim_exps.astype(np.float64)
+    sum_current_prim_dim_exps = np.abs(current_prim_dim_dec).sum()
+    counter = 0
+    while sum_current_prim_dim_exps > 1e-8 and counter < max_iter:
+        # Find the known dimension whose division (sign = 1) or multiplication (sign = -1)
+        # leaves the smallest sum of absolute exponents. Divisions are checked first, and only
+        # a strictly smaller sum replaces the current best, i.e. ties go to the first candidate.
+        best_sum = np.inf
+        best_dim_idx = 0
+        best_sign = 1
+        for sign in (1, -1):
+            for dim_idx in range(num_dims):
+                dim_sum = 0.0
+                for prim_idx in range(num_prim_dims):
+                    dim_sum += abs(
+                        current_prim_dim_dec[prim_idx]
+                        - sign * db_prim_exps[dim_idx, prim_idx]
+                    )
+                if dim_sum < best_sum:
+                    best_sum = dim_sum
+                    best_dim_idx = dim_idx
+                    best_sign = sign
+        new_dim_dec[best_dim_idx] += best_sign
+        for prim_idx in range(num_prim_dims):
+            current_prim_dim_dec[prim_idx] -= (
+                best_sign * db_prim_exps[best_dim_idx, prim_idx]
+            )
+        sum_current_prim_dim_exps = best_sum
+        counter += 1
+    return new_dim_dec
+
+
+@_compile(parallel=True)
+def affine_transform(values: np.ndarray, shift: float, factor: float) -> np.ndarray:
+    """
+    Calculate `(values + shift) * factor` for a float64 array in a single pass over the data,
+    in parallel; see `Quantity._convert_unit`.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Array of values to transform.
+    shift : float
+        Value added to each element before multiplication.
+    factor : float
+        Value by which each shifted element is multiplied.
+
+    Returns
+    -------
+        numpy.ndarray
+        New array with the same shape as `values`.
+    """
+    flat_values = values.ravel()
+    transformed = np.empty(flat_values.size)
+    for idx in prange(flat_values.size):
+        transformed[idx] = (flat_values[idx] + shift) * factor
+    return transformed.reshape(values.shape)
+
+
+@_compile
+def conversion_coefficients(
+    units_exps: np.ndarray,
+    temp_units_idx: np.ndarray,
+    temp_conv_shifts: np.ndarray,
+    non_temp_units_idx: np.ndarray,
+    non_temp_conv_factors: np.ndarray,
+) -> Tuple[float, float]:
+    """
+    Conversion shift and conversion factor of a unit to SI units, in a single scalar loop
+    over each group of units; see `Unit.conversion_coefficients_to_si`.
+
+    Parameters
+    ----------
+    units_exps : numpy.ndarray
+        1D-array of exponents of all units in the database.
+    temp_units_idx : numpy.ndarray
+        Indices of temperature units in `units_exps`.
+    temp_conv_shifts : numpy.ndarray
+        Conversion shift of each temperature unit.
+    non_temp_units_idx : numpy.ndarray
+        Indices of all other units in `units_exps`.
+    non_temp_conv_factors : numpy.ndarray
+        Conversion factor of each of the other units.
+
+    Returns
+    -------
+        (conv_shift, conv_factor) : tuple[float, float]
+    """
+    conv_shift = 0.0
+    for idx in range(temp_units_idx.size):
+        exp = units_exps[temp_units_idx[idx]]
+        # Only temperature units with positive exponents have a conversion shift
+        if exp > 0:
+            conv_shift += exp * temp_conv_shifts[idx]
+    conv_factor = 1.0
+    for idx in range(non_temp_units_idx.size):
+        exp = units_exps[non_temp_units_idx[idx]]
+        if exp != 0:
+            conv_factor *= non_temp_conv_factors[idx] ** exp
+    return conv_shift, conv_factor
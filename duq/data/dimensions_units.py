@@ -1,17 +1,65 @@
 """
 Data on primary and derived physical dimensions and units.
+
+Each unit is described by its name, symbol, conversion factor and prefix exponent.
+The conversion factor `conv_factor` is the complete factor for converting the unit into the SI unit
+of its dimension, i.e. the metric prefix of the unit (if any) is already folded into it,
+so that no further scaling is needed at conversion time (e.g. 1e-3 for gram, 4184 for kilocalorie).
+For temperature units, `conv_factor` is instead the conversion shift to kelvin.
+The prefix exponent `prefix_exp` is the decimal exponent of the unit's metric prefix only
+(e.g. 3 for kilogram, 0 for gram), and is not used in conversions.
+Moreover, each unit holds the exponents of the primary dimension decomposition of its dimension
+under `prim_dim_exps`, as a view of the corresponding row of the module-level `prim_dim_exps`.
 """
 
+import sys
+from math import log10
+from types import MappingProxyType
+from collections import namedtuple
+
 import numpy as np
 
 from .metric_prefixes import greater_one, smaller_one
 
 
+# Exponents of the primary dimension decomposition of all (primary and derived) dimensions,
+# stored together in a single contiguous array. Each row corresponds to one dimension, in the same
+# order as they appear in `primary` and `derived` below, and each column to one primary dimension,
+# in the order: [mass, length, time, electric current, temperature, amount of substance, luminous
+# intensity]. The `prim_dim_exps` entry of each dimension's dictionary is a view of its row.
+# Exponents of known dimensions are small integers, so they are stored as 8-bit integers.
+# The rows of primary dimensions are the unit vectors, and those of derived dimensions are written
+# as integer combinations of them.
+_prim_dims = np.eye(7, dtype=np.int8)
+_mass, _length, _time, _current, _temperature, _amount, _luminous = _prim_dims
+prim_dim_exps = np.concatenate(
+    (
+        _prim_dims,
+        np.array(
+            [
+                np.zeros(7, dtype=np.int8),  # dimensionless
+                2 * _length,  # area
+                3 * _length,  # volume
+                -_time,  # frequency
+                _mass - 3 * _length,  # density
+                _mass - _length - 2 * _time,  # pressure
+                _time + _current,  # electric_charge
+                _length - _time,  # velocity
+                _mass + _length - _time,  # momentum
+                _length - 2 * _time,  # acceleration
+                _mass + _length - 2 * _time,  # force
+                _mass + 2 * _length - 2 * _time,  # energy
+            ],
+            dtype=np.int8,
+        ),
+    )
+)
+prim_dim_exps.flags.writeable = False
+
 primary = {
     "mass": {
         "name": "mass",
         "symbol": "M",
-        "prim_dim_exps": np.array([1, 0, 0, 0, 0, 0, 0]),
         "units": {
             "kilogram": {
                 "name": "kilogram",
@@ -42,7 +90,6 @@ primary = {
     "length": {
         "name": "length",
         "symbol": "L",
-        "prim_dim_exps": np.array([0, 1, 0, 0, 0, 0, 0]),
         "units": {
             "metre": {
                 "name": "metre",
@@ -67,7 +114,6 @@ primary = {
     "time": {
         "name": "time",
         "symbol": "T",
-        "prim_dim_exps": np.array([0, 0, 1, 0, 0, 0, 0]),
         "units": {
             "second": {
                 "name": "second",
@@ -80,7 +126,6 @@ primary = {
     "electric_current": {
         "name": "electric current",
         "symbol": "I",
-        "prim_dim_exps": np.array([0, 0, 0, 1, 0, 0, 0]),
         "units": {
             "ampere": {
                 "name": "ampere",
@@ -93,7 +138,6 @@ primary = {
     "temperature": {
         "name": "temperature",
         "symbol": "Θ",
-        "prim_dim_exps": np.array([0, 0, 0, 0, 1, 0, 0]),
         "units": {
             "kelvin": {
                 "name": "kelvin",
@@ -112,13 +156,11 @@ primary = {
     "amount_substance": {
         "name": "amount of substance",
         "symbol": "N",
-        "prim_dim_exps": np.array([0, 0, 0, 0, 0, 1, 0]),
         "units": {"mole": {"name": "mole", "symbol": "mol", "conv_factor": 1, "prefix_exp": 0}},
     },
     "luminous_intensity": {
         "name": "luminous intensity",
         "symbol": "J",
-        "prim_dim_exps": np.array([0, 0, 0, 0, 0, 0, 1]),
         "units": {
             "candela": {
                 "name": "candela",
@@ -134,7 +176,6 @@ derived = {
     "dimensionless": {
         "name": "dimensionless",
         "symbol": "1",
-        "prim_dim_exps": np.array([0, 0, 0, 0, 0, 0, 0]),
         "units": {
             "radian": {
                 "name": "radian",
@@ -153,7 +194,6 @@ derived = {
     "area": {
         "name": "area",
         "symbol": "Ar",
-        "prim_dim_exps": np.array([0, 2, 0, 0, 0, 0, 0]),
         "units": {
             "square_metre": {
                 "name": "square metre",
@@ -166,7 +206,6 @@ derived = {
     "volume": {
         "name": "volume",
         "symbol": "Vol",
-        "prim_dim_exps": np.array([0, 3, 0, 0, 0, 0, 0]),
         "units": {
             "cubic_metre": {
                 "name": "cubic metre",
@@ -185,7 +224,6 @@ derived = {
     "frequency": {
         "name": "frequency",
         "symbol": "ν",
-        "prim_dim_exps": np.array([0, 0, -1, 0, 0, 0, 0]),
         "units": {
             "hertz": {
                 "name": "hertz",
@@ -198,7 +236,6 @@ derived = {
     "density": {
         "name": "density",
         "symbol": "ρ",
-        "prim_dim_exps": np.array([1, -3, 0, 0, 0, 0, 0]),
         "units": {
             "kilogram_per_cubic_metre": {
                 "name": "kilogram per cubic metre",
@@ -211,7 +248,6 @@ derived = {
     "pressure": {
         "name": "pressure",
         "symbol": "P",
-        "prim_dim_exps": np.array([1, -1, -2, 0, 0, 0, 0]),
         "units": {
             "pascal": {
                 "name": "pascal",
@@ -236,7 +272,6 @@ derived = {
     "electric_charge": {
         "name": "electric charge",
         "symbol": "Q",
-        "prim_dim_exps": np.array([0, 0, 1, 1, 0, 0, 0]),
         "units": {
             "coulomb": {
                 "name": "Coulomb",
@@ -255,7 +290,6 @@ derived = {
     "velocity": {
         "name": "velocity",
         "symbol": "V",
-        "prim_dim_exps": np.array([0, 1, -1, 0, 0, 0, 0]),
         "units": {
             "metre_per_second": {
                 "name": "metre per second",
@@ -268,7 +302,6 @@ derived = {
     "momentum": {
         "name": "momentum",
         "symbol": "Mom",
-        "prim_dim_exps": np.array([1, 1, -1, 0, 0, 0, 0]),
         "units": {
             "kilogram_metre_per_second": {
                 "name": "kilogram metre per second",
@@ -281,7 +314,6 @@ derived = {
     "acceleration": {
         "name": "acceleration",
         "symbol": "A",
-        "prim_dim_exps": np.array([0, 1, -2, 0, 0, 0, 0]),
         "units": {
             "metre_per_square_second": {
                 "name": "metre per second squared",
@@ -294,7 +326,6 @@ derived = {
     "force": {
         "name": "force",
         "symbol": "F",
-        "prim_dim_exps": np.array([1, 1, -2, 0, 0, 0, 0]),
         "units": {
             "newton": {
                 "name": "newton",
@@ -307,7 +338,6 @@ derived = {
     "energy": {
         "name": "energy",
         "symbol": "E",
-        "prim_dim_exps": np.array([1, 2, -2, 0, 0, 0, 0]),
         "units": {
             "joule": {
                 "name": "joule",
@@ -338,24 +368,114 @@ derived = {
 }
 
 
-# Creating more units from prefixes
-for prefix in ["centi", "milli", "micro", "nano", "pico", "femto", "atto"]:
-    pre = smaller_one[prefix]
-    p_symb = pre["symbol"]
-    p_name = pre["name"]
-    p_factor = pre["factor"]
+# Index of each dimension's row in `prim_dim_exps`
+dim_idx = {dim_name: idx for idx, dim_name in enumerate(primary | derived)}
+for dim_name, dim in (primary | derived).items():
+    dim["prim_dim_exps"] = prim_dim_exps[dim_idx[dim_name]]
+
 
-    # for length, from metre
-    primary["length"]["units"][f"{p_name}metre"] = {
-        "name": f"{p_name}metre",
-        "symbol": f"{pre['symbol']}m",
-        "conv_factor": p_factor,
-        "prefix_exp": p_factor,
+# Creating more units from prefixes
+_prefixes = [smaller_one[p] for p in ("centi", "milli", "micro", "nano", "pico", "femto", "atto")]
+# for length, from metre
+primary["length"]["units"].update(
+    {
+        f"{pre['name']}metre": {
+            "name": f"{pre['name']}metre",
+            "symbol": f"{pre['symbol']}m",
+            "conv_factor": pre["factor"],
+            "prefix_exp": int(round(log10(pre["factor"]))),
+        }
+        for pre in _prefixes
     }
-    # for time, from second
-    primary["time"]["units"][f"{p_name}second"] = {
-        "name": f"{p_name}second",
-        "symbol": f"{p_symb}s",
-        "conv_factor": p_factor,
-        "prefix_exp": p_factor,
+)
+# for time, from second
+primary["time"]["units"].update(
+    {
+        f"{pre['name']}second": {
+            "name": f"{pre['name']}second",
+            "symbol": f"{pre['symbol']}s",
+            "conv_factor": pre["factor"],
+            "prefix_exp": int(round(log10(pre["factor"]))),
+        }
+        for pre in _prefixes
     }
+)
+
+
+# Intern the names and symbols of all dimensions and units, since these are used as lookup keys
+for dim in (primary | derived).values():
+    for entry in (dim, *dim["units"].values()):
+        entry["name"] = sys.intern(entry["name"])
+        entry["symbol"] = sys.intern(entry["symbol"])
+
+
+# All data is now complete; freeze the dictionaries of all dimensions and units
+# (and the dictionaries containing them) into read-only mappings.
+# Each unit also gets the `prim_dim_exps` entry of its dimension.
+def _freeze_dims(dims: dict) -> MappingProxyType:
+    return MappingProxyType(
+        {
+            dim_name: MappingProxyType(
+                dim
+                | {
+                    "units": MappingProxyType(
+                        {
+                            unit_key: MappingProxyType(
+                                unit | {"prim_dim_exps": dim["prim_dim_exps"]}
+                            )
+                            for unit_key, unit in dim["units"].items()
+                        }
+                    )
+                }
+            )
+            for dim_name, dim in dims.items()
+        }
+    )
+
+
+primary = _freeze_dims(primary)
+derived = _freeze_dims(derived)
+
+# Hashable, immutable record of each unit's data, by unit name
+UnitData = namedtuple("UnitData", ["name", "symbol", "conv_factor", "prefix_exp"])
+unit_tuples = {
+    unit["name"]: UnitData(unit["name"], unit["symbol"], unit["conv_factor"], unit["prefix_exp"])
+    for dim in (primary | derived).values()
+    for unit in dim["units"].values()
+}
+
+
+# Flat indices of all units by their symbol and by their name, mapping each to a tuple of
+# (name of dimension, key of unit in the dimension's "units" dictionary, unit dictionary)
+unit_by_symbol = {
+    unit["symbol"]: (dim_name, unit_key, unit)
+    for dim_name, dim in (primary | derived).items()
+    for unit_key, unit in dim["units"].items()
+}
+unit_by_name = {
+    unit["name"]: (dim_name, unit_key, unit)
+    for dim_name, dim in (primary | derived).items()
+    for unit_key, unit in dim["units"].items()
+}
+
+
+# All (primary and derived) units in a single structured array, with one row per unit, where units
+# are ordered in the same way as their dimensions in `primary` and `derived`. This allows for
+# columnar access to each property of all units at once, e.g. `units["conv_factor"]`.
+_units_rows = [
+    (unit["name"], unit["symbol"], unit["conv_factor"], unit["prefix_exp"], dim_idx[dim_name])
+    for dim_name, dim in (primary | derived).items()
+    for unit in dim["units"].values()
+]
+units = np.array(
+    _units_rows,
+    dtype=[
+        ("name", f"U{max(len(row[0]) for row in _units_rows)}"),
+        ("symbol", f"U{max(len(row[1]) for row in _units_rows)}"),
+        ("conv_factor", np.float64),
+        ("prefix_exp", np.int8),
+        ("dim_idx", np.int16),
+    ],
+)
+# Index of each unit's row in `units`
+unit_idx = {row[0]: idx for idx, row in enumerate(_units_rows)}
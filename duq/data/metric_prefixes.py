@@ -1,70 +1,93 @@
 """
-Dictionaries containing metric prefixes, their names, symbols, and factor.
-These are also categorized into two dictionaries `greater_one` and `smaller_one`.
+Read-only mappings of metric prefixes, their names, symbols, and factor.
+All prefixes are collected in the read-only mapping `prefixes`, from which the two
+read-only mappings `greater_one` and `smaller_one` are derived.
 """
 
-yotta = {"name": "yotta", "symbol": "Y", "factor": 1e24}
+import sys
+from types import MappingProxyType
 
-zetta = {"name": "zetta", "symbol": "Z", "factor": 1e21}
 
-exa = {"name": "exa", "symbol": "E", "factor": 1e18}
+def _prefix(name: str, symbol: str, factor: float) -> MappingProxyType:
+    """
+    Read-only mapping of a metric prefix. The name and symbol are interned,
+    since these are used as lookup keys.
+    """
+    return MappingProxyType(
+        {"name": sys.intern(name), "symbol": sys.intern(symbol), "factor": factor}
+    )
 
-peta = {"name": "peta", "symbol": "P", "factor": 1e15}
 
-tera = {"name": "tera", "symbol": "T", "factor": 1e12}
+yotta = _prefix("yotta", "Y", 1e24)
 
-giga = {"name": "giga", "symbol": "G", "factor": 1e9}
+zetta = _prefix("zetta", "Z", 1e21)
 
-mega = {"name": "mega", "symbol": "M", "factor": 1e6}
+exa = _prefix("exa", "E", 1e18)
 
-kilo = {"name": "kilo", "symbol": "k", "factor": 1e3}
+peta = _prefix("peta", "P", 1e15)
 
-hecto = {"name": "hecto", "symbol": "h", "factor": 1e2}
+tera = _prefix("tera", "T", 1e12)
 
-deca = {"name": "deca", "symbol": "da", "factor": 1e1}
+giga = _prefix("giga", "G", 1e9)
 
-deci = {"name": "deci", "symbol": "d", "factor": 1e-1}
+mega = _prefix("mega", "M", 1e6)
 
-centi = {"name": "centi", "symbol": "c", "factor": 1e-2}
+kilo = _prefix("kilo", "k", 1e3)
 
-milli = {"name": "milli", "symbol": "m", "factor": 1e-3}
+hecto = _prefix("hecto", "h", 1e2)
 
-micro = {"name": "micro", "symbol": "μ", "factor": 1e-6}
+deca = _prefix("deca", "da", 1e1)
 
-nano = {"name": "nano", "symbol": "n", "factor": 1e-9}
+deci = _prefix("deci", "d", 1e-1)
 
-pico = {"name": "pico", "symbol": "p", "factor": 1e-12}
+centi = _prefix("centi", "c", 1e-2)
 
-femto = {"name": "femto", "symbol": "f", "factor": 1e-15}
+milli = _prefix("milli", "m", 1e-3)
 
-atto = {"name": "atto", "symbol": "a", "factor": 1e-18}
+micro = _prefix("micro", "μ", 1e-6)
 
-zepto = {"name": "zepto", "symbol": "z", "factor": 1e-21}
+nano = _prefix("nano", "n", 1e-9)
 
-yocto = {"name": "yocto", "symbol": "y", "factor": 1e-24}
+pico = _prefix("pico", "p", 1e-12)
 
-greater_one = {
-    "yotta": yotta,
-    "zetta": zetta,
-    "exa": exa,
-    "peta": peta,
-    "tera": tera,
-    "giga": giga,
-    "mega": mega,
-    "kilo": kilo,
-    "hecto": hecto,
-    "deca": deca,
-}
+femto = _prefix("femto", "f", 1e-15)
 
-smaller_one = {
-    "deci": deci,
-    "centi": centi,
-    "milli": milli,
-    "micro": micro,
-    "nano": nano,
-    "pico": pico,
-    "femto": femto,
-    "atto": atto,
-    "zepto": zepto,
-    "yocto": yocto,
-}
+atto = _prefix("atto", "a", 1e-18)
+
+zepto = _prefix("zepto", "z", 1e-21)
+
+yocto = _prefix("yocto", "y", 1e-24)
+
+# All metric prefixes, ordered from the largest to the smallest factor
+prefixes = MappingProxyType(
+    {
+        "yotta": yotta,
+        "zetta": zetta,
+        "exa": exa,
+        "peta": peta,
+        "tera": tera,
+        "giga": giga,
+        "mega": mega,
+        "kilo": kilo,
+        "hecto": hecto,
+        "deca": deca,
+        "deci": deci,
+        "centi": centi,
+        "milli": milli,
+        "micro": micro,
+        "nano": nano,
+        "pico": pico,
+        "femto": femto,
+        "atto": atto,
+        "zepto": zepto,
+        "yocto": yocto,
+    }
+)
+
+greater_one = MappingProxyType(
+    {name: prefix for name, prefix in prefixes.items() if prefix["factor"] > 1}
+)
+
+smaller_one = MappingProxyType(
+    {name: prefix for name, prefix in prefixes.items() if prefix["factor"] < 1}
+)
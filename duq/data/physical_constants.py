@@ -1,4 +1,17 @@
-phys_consts = {
+"""
+Read-only mappings of physical constants, their names, symbols, values and units.
+The numerical values are also provided as a flat float64 array `phys_const_values`
+(e.g. for passing to compiled numerical kernels), where the index of each constant
+is given in `phys_const_idx`, and as the immutable named tuple `phys_const`,
+allowing for attribute access, e.g. `phys_const.avogadro_const`.
+"""
+
+from types import MappingProxyType
+from collections import namedtuple
+
+import numpy as np
+
+_phys_consts = {
     "avogadro_const": {
         "name": "Avogadro constant",
         "symbol": "N_A",
@@ -48,3 +61,22 @@ phys_consts = {
         "unit": "m^3.kg^-1.s^-2",
     },
 }
+# Freeze the mapping and each constant in it, so that no value can drift from the derived
+# `phys_const_values` and `phys_const` below
+phys_consts = MappingProxyType(
+    {name: MappingProxyType(const) for name, const in _phys_consts.items()}
+)
+
+# Names of constants, in the order of `phys_const_values`
+phys_const_names = tuple(phys_consts.keys())
+# Values of all constants as a single contiguous array
+phys_const_values = np.array(
+    [const["value"] for const in phys_consts.values()], dtype=np.float64
+)
+phys_const_values.flags.writeable = False
+# Index of each constant in `phys_const_values`
+phys_const_idx = {name: idx for idx, name in enumerate(phys_const_names)}
+
+# Values of all constants as an immutable named tuple, with the same names as in `phys_consts`
+PhysConstValues = namedtuple("PhysConstValues", phys_const_names)
+phys_const = PhysConstValues(*(const["value"] for const in phys_consts.values()))
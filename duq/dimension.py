@@ -6,17 +6,18 @@ Contains all functionalities for dimensional analysis and working with physical
 # Standard library
 from __future__ import annotations
 from typing import Union, Sequence, Tuple
-from functools import partial
+from functools import partial, cached_property
 from itertools import combinations
 
 # 3rd-party
 import numpy as np
 
 # Self
-from .data.dimensions_units import primary, derived
+from .data.dimensions_units import primary, derived, prim_dim_exps
 from .helpers import parse_base_with_exp_string as parse_base_exp
 from .helpers import generate_symbol_for_base_exp_series as gen_symbol
-from .helpers import raise_for_type, order_for_repr
+from .helpers import raise_for_type, indices_for_repr
+from ._kernels import shortest_composition as shortest_composition_kernel
 
 
 __all__ = ("Dimension", "predefined")
@@ -62,7 +63,70 @@ class Dimension:
     _db_si_units: np.ndarray = np.array(
         [list(dim["units"].values())[0]["symbol"] for dim in _db_all.values()]
     )
-    _db_prim_exps: np.ndarray = np.array([dim["prim_dim_exps"] for dim in _db_all.values()])
+    _db_prim_exps: np.ndarray = prim_dim_exps
+    # Same as `_db_prim_exps`, as a C-contiguous float64 array for matrix products with exponents
+    _db_prim_exps_float: np.ndarray = np.ascontiguousarray(prim_dim_exps, dtype=np.float64)
+    _db_prim_exps_float.flags.writeable = False
+    # Mapping of each name and symbol in the database to the index of its dimension
+    _db_idx: dict = {name: idx for idx, name in enumerate(_db_names.tolist())} | {
+        symbol: idx for idx, symbol in enumerate(_db_symbols.tolist())
+    }
+    # Index of the 'amount of substance' dimension
+    _db_amount_of_subst_idx: int = _db_idx["N"]
+    # Indices for re-ordering dimensions for name and symbol representations
+    _db_repr_order: np.ndarray = indices_for_repr(_db_names.size, _prim_dim_count)
+    # Cache for the output of `_db_equiv_dim_systems`
+    _db_equiv_dim_systems_cache: Union[Tuple[np.ndarray, np.ndarray], None] = None
+    # Names of properties that are cached on each instance after their first calculation
+    _cached_property_names: Tuple[str, ...] = (
+        "name_as_is",
+        "symbol_as_is",
+        "si_unit_as_is",
+        "exponents_primary_decomposition",
+        "_cached_equiv_dim_shortest_composition",
+        "_cached_equiv_dim_primary_decomposition",
+    )
+
+    @classmethod
+    def _db_equiv_dim_systems(cls) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Index array of all combinations of 7 available dimensions that have a unique primary
+        dimension decomposition, together with the corresponding (transposed) matrices of
+        primary dimension decomposition exponents; used in `equiv_dim_all`.
+        Since these only depend on the class database, they are calculated once on first use,
+        and cached for all subsequent calls.
+
+        Returns
+        -------
+            tuple[numpy.ndarray, numpy.ndarray]
+            The index array with shape (b, 7) and the array of matrices with shape (b, 7, 7).
+        """
+        if cls._db_equiv_dim_systems_cache is not None:
+            return cls._db_equiv_dim_systems_cache
+        # Create an index array of all unique combinations of indices of the available dimensions.
+        # The array will have a shape of (b, n), where b is the binomial coefficient (s, n), where
+        # s is the number of available dimensions in the class database (size of cls._db_names),
+        # and n is the number of primary dimensions, i.e. 7.
+        # With the current number of available dimensions (19), the shape will be (50388, 7).
+        combs = np.array(list(combinations(range(cls._db_names.size), cls._prim_dim_count)))
+
+        # Create the matrices of primary dimension decomposition exponents of the 7 available
+        # dimensions in each combination, transposed, so that solving the system of linear
+        # equations for each matrix gives the exponents of those 7 dimensions that result in
+        # the current dimension.
+        matrices = cls._db_prim_exps_float[combs].transpose(0, 2, 1)
+        # Some matrices are singular, in which case there is no unique solution; filter them out.
+        # Since all exponents in the database are integers, the determinant of each matrix is
+        # also an integer, and thus non-singular matrices have determinants of at least 1 in
+        # absolute value.
+        non_singular_mask = np.abs(np.linalg.det(matrices)) > 0.5
+        cls._db_equiv_dim_systems_cache = (
+            combs[non_singular_mask],
+            matrices[non_singular_mask],
+        )
+        for array in cls._db_equiv_dim_systems_cache:
+            array.flags.writeable = False
+        return cls._db_equiv_dim_systems_cache
 
     @classmethod
     def supported_input_dimensions(cls) -> Tuple:
@@ -93,7 +157,28 @@ class Dimension:
         """
         all_dims_exps = np.zeros(cls._db_names.size)
         all_dims_exps[: cls._prim_dim_count] = prim_dims_exps
-        return cls(all_dims_exps)
+        return cls._from_exps(all_dims_exps)
+
+    @classmethod
+    def _from_exps(cls, all_dims_exps: np.ndarray) -> Dimension:
+        """
+        Construct a Dimension object directly from an array of exponents of all dimensions,
+        without any validation and without copying the array.
+        For internal use only; the array must be a new float64 array
+        with the same shape as `_db_names`, which is not shared with any other object.
+
+        Parameters
+        ----------
+        all_dims_exps : numpy.ndarray
+            Exponents of all dimensions in the database.
+
+        Returns
+        -------
+            Dimension
+        """
+        dimension = cls.__new__(cls)
+        dimension._all_dims_exps = all_dims_exps
+        return dimension
 
     def __init__(self, dimension):
         self._all_dims_exps = np.zeros(self._db_names.size)
@@ -103,11 +188,10 @@ class Dimension:
             else:
                 dims, exps = parse_base_exp(dimension)
                 for dim, exp in zip(dims, exps):
-                    mask = (self._db_symbols == dim) + (self._db_names == dim)
-                    if np.any(mask):
-                        self._all_dims_exps[mask] += exp
-                    else:
+                    dim_idx = self._db_idx.get(dim)
+                    if dim_idx is None:
                         raise ValueError(f"Dimension {dim} not recognized.")
+                    self._all_dims_exps[dim_idx] += exp
         elif isinstance(dimension, (list, np.ndarray)):
             all_dims_exps = np.array(dimension)
             if all_dims_exps.shape != self._all_dims_exps.shape:
@@ -157,10 +241,11 @@ class Dimension:
         return self._all_dims_exps + other._all_dims_exps
 
     def __mul__(self, other):
-        return Dimension(self.__mul_common__(other))
+        return Dimension._from_exps(self.__mul_common__(other))
 
     def __imul__(self, other):
         self._all_dims_exps = self.__mul_common__(other)
+        self._clear_cached_properties()
         return self
 
     def __truediv_common__(self, other):
@@ -168,10 +253,11 @@ class Dimension:
         return self._all_dims_exps - other._all_dims_exps
 
     def __truediv__(self, other):
-        return Dimension(self.__truediv_common__(other))
+        return Dimension._from_exps(self.__truediv_common__(other))
 
     def __itruediv__(self, other):
         self._all_dims_exps = self.__truediv_common__(other)
+        self._clear_cached_properties()
         return self
 
     def __pow_common__(self, power):
@@ -179,68 +265,76 @@ class Dimension:
         return self._all_dims_exps * power
 
     def __pow__(self, power):
-        return Dimension(self.__pow_common__(power))
+        return Dimension._from_exps(self.__pow_common__(power))
 
     def __ipow__(self, power):
         self._all_dims_exps = self.__pow_common__(power)
+        self._clear_cached_properties()
         return self
 
-    @property
+    def _clear_cached_properties(self) -> None:
+        """
+        Remove the cached values of all cached properties, which are pure functions of the
+        dimension's exponents. This must be called after the exponents are changed in place.
+        """
+        for name in self._cached_property_names:
+            self.__dict__.pop(name, None)
+
+    @cached_property
     def name_as_is(self) -> str:
         """
         Name representation of the current dimension, with not simplification applied.
         """
-        names_ordered, exps_ordered = order_for_repr(
-            [self._db_names, self._all_dims_exps], self._prim_dim_count
+        order = self._db_repr_order
+        names_ordered, exps_ordered = self._db_names[order], self._all_dims_exps[order]
+        return gen_symbol(names_ordered, exps_ordered, " . ", nested_bases=False).replace(
+            "empty", "dimensionless"
         )
-        return gen_symbol(names_ordered, exps_ordered, " . ").replace("empty", "dimensionless")
 
     @property
     def name_shortest_composition(self) -> str:
         """
         Name representation of the shortest equivalent composition for the current dimension.
         """
-        return self.equiv_dim_shortest_composition.name_as_is
+        return self._cached_equiv_dim_shortest_composition.name_as_is
 
     @property
     def name_primary_decomposition(self) -> str:
         """
         Name representation of the equivalent primary dimension decomposition of the current dimension.
         """
-        return self.equiv_dim_primary_decomposition.name_as_is
+        return self._cached_equiv_dim_primary_decomposition.name_as_is
 
-    @property
+    @cached_property
     def symbol_as_is(self) -> str:
         """
         Symbol representation of the current dimension, with not simplification applied.
         """
-        symbols_ordered, exps_ordered = order_for_repr(
-            [self._db_symbols, self._all_dims_exps], self._prim_dim_count
-        )
-        return gen_symbol(symbols_ordered, exps_ordered).replace("empty", "1")
+        order = self._db_repr_order
+        symbols_ordered, exps_ordered = self._db_symbols[order], self._all_dims_exps[order]
+        return gen_symbol(symbols_ordered, exps_ordered, nested_bases=False).replace("empty", "1")
 
     @property
     def symbol_shortest_composition(self) -> str:
         """
         Symbol representation of the shortest equivalent composition for the current dimension.
         """
-        return self.equiv_dim_shortest_composition.symbol_as_is
+        return self._cached_equiv_dim_shortest_composition.symbol_as_is
 
     @property
     def symbol_primary_decomposition(self) -> str:
         """
         Symbol representation of the equivalent primary dimension decomposition of the current dimension.
         """
-        return self.equiv_dim_primary_decomposition.symbol_as_is
+        return self._cached_equiv_dim_primary_decomposition.symbol_as_is
 
-    @property
+    @cached_property
     def si_unit_as_is(self) -> str:
         """
         SI-unit representation of the current dimension, with not simplification applied.
         """
-        si_units_ordered, exps_ordered = order_for_repr(
-            [self._db_si_units, self._all_dims_exps], self._prim_dim_count
-        )
+        order = self._db_repr_order
+        si_units_ordered, exps_ordered = self._db_si_units[order], self._all_dims_exps[order]
         return gen_symbol(si_units_ordered, exps_ordered, ".").replace("empty", "1")
 
     @property
@@ -248,14 +342,14 @@ class Dimension:
         """
         SI-unit representation of the shortest equivalent composition for the current dimension.
         """
-        return self.equiv_dim_shortest_composition.si_unit_as_is
+        return self._cached_equiv_dim_shortest_composition.si_unit_as_is
 
     @property
     def si_unit_primary_decomposition(self) -> str:
         """
         SI-unit representation of the equivalent primary dimension decomposition of the current dimension.
         """
-        return self.equiv_dim_primary_decomposition.si_unit_as_is
+        return self._cached_equiv_dim_primary_decomposition.si_unit_as_is
 
     @property
     def exponents_as_is(self) -> np.ndarray:
@@ -270,17 +364,25 @@ class Dimension:
         """
         Array of exponents for each constituting dimension of the shortest equivalent composition
         for the current dimension. The order of dimensions is the same as returned by
-        `Dimension.supported_input_dimensions()`.
+        `Dimension.supported_input_dimensions()`. The array is cached, and is thus returned as
+        read-only.
         """
-        return self.equiv_dim_shortest_composition.exponents_as_is
+        exps = self._cached_equiv_dim_shortest_composition._all_dims_exps.copy()
+        exps.flags.writeable = False
+        return exps
 
-    @property
+    @cached_property
     def exponents_primary_decomposition(self) -> np.ndarray:
         """
         Array of exponents of the primary dimension decomposition of the current dimension, in the order:
         [mass, length, time, electric current, temperature, amount of substance, luminous intensity].
+        The array is cached, and is thus returned as read-only.
         """
-        return self.equiv_dim_primary_decomposition.exponents_as_is[: self._prim_dim_count]
+        exps = self._cached_equiv_dim_primary_decomposition._all_dims_exps[
+            : self._prim_dim_count
+        ].copy()
+        exps.flags.writeable = False
+        return exps
 
     @property
     def is_primary_dimension(self) -> bool:
@@ -302,42 +404,59 @@ class Dimension:
             as the current dimension, but composed of the least possible number
             of known dimensions.
         """
+        # A copy is returned, so that modifying it can't change the cached object
+        return Dimension._from_exps(
+            self._cached_equiv_dim_shortest_composition._all_dims_exps.copy()
+        )
+
+    @cached_property
+    def _cached_equiv_dim_shortest_composition(self) -> Dimension:
+        """
+        Base function used by `equiv_dim_shortest_composition`, which calculates its value.
+        The object is cached and shared, and thus must not be modified in-place.
+        """
+        # Use the compiled kernel of the same algorithm when Numba is available
+        if shortest_composition_kernel is not None:
+            return Dimension._from_exps(
+                shortest_composition_kernel(
+                    self.exponents_primary_decomposition, self._db_prim_exps, 100
+                )
+            )
         # Create empty array for storing dimension decomposition of the equivalent dimension
         new_dim_dec = np.zeros_like(self._all_dims_exps)
         # Note the current state of the primary dimension decomposition of the dimension
         current_prim_dim_dec = self.exponents_primary_decomposition
         sum_current_prim_dim_exps = np.abs(current_prim_dim_dec).sum()
-        # Create index array for use in the While loop, since we are concatenating two arrays
-        dim_idxs = np.tile(np.arange(self._all_dims_exps.size), 2)
-        # Repeat until all current primary dimensions are consumed
+        # Repeat until all current primary dimensions are consumed, i.e. the (non-negative) sum of
+        # absolute exponents is zero within the default tolerance of `np.isclose`
         counter = 0
-        while (not np.isclose(sum_current_prim_dim_exps, 0)) and (counter < 100):
-            # Subtract all known dimension decompositions from the current decomposition
-            subtraction = current_prim_dim_dec - self._db_prim_exps
-            # And also add
-            addition = current_prim_dim_dec + self._db_prim_exps
-            # Concatenate the two resulting arrays for avoiding repetition of code
-            sub_add = np.concatenate((subtraction, addition))
-            # Take the absolute value of all dimension exponents, and sum them
-            sub_add_result = np.abs(sub_add).sum(axis=1)
-            # The best result is the one with the smallest sum; note its index
-            best_result_idx = np.argmin(sub_add_result)
-            # Also note the actual index of the dimension that gave the best resul
-            best_result_dim_idx = dim_idxs[best_result_idx]
+        while sum_current_prim_dim_exps > 1e-8 and counter < 100:
+            # Subtract all known dimension decompositions from the current decomposition,
+            # and also add them; take the absolute value of all dimension exponents, and sum them
+            subtraction_sums = np.abs(current_prim_dim_dec - self._db_prim_exps).sum(axis=1)
+            addition_sums = np.abs(current_prim_dim_dec + self._db_prim_exps).sum(axis=1)
+            # The best result is the one with the smallest sum; note the index of the dimension
+            # that gave the best result in each case
+            best_subtraction_idx = np.argmin(subtraction_sums)
+            best_addition_idx = np.argmin(addition_sums)
             # Add +1/-1 to the exponent of the dimension that gave the best result
             # Note: if the best result was obtained via subtraction (i.e. dividing by another dimension)
             # then +1 should be added as the exponent; otherwise if the result was obtained via addition
             # (i.e. multiplying with another exponent), then -1 should be added as the exponent.
-            # This is inferred from the index of the best result, i.e. finding out if it was in the first
-            # or second half of the concatenated list.
-            new_dim_dec[best_result_dim_idx] += (
-                1 if best_result_idx < self._all_dims_exps.size else -1
-            )
+            # On ties, subtraction is preferred.
+            if subtraction_sums[best_subtraction_idx] <= addition_sums[best_addition_idx]:
+                best_result_dim_idx, sign = best_subtraction_idx, 1
+                sum_current_prim_dim_exps = subtraction_sums[best_subtraction_idx]
+            else:
+                best_result_dim_idx, sign = best_addition_idx, -1
+                sum_current_prim_dim_exps = addition_sums[best_addition_idx]
+            new_dim_dec[best_result_dim_idx] += sign
             # Update the current state
-            current_prim_dim_dec = sub_add[best_result_idx]
-            sum_current_prim_dim_exps = np.abs(current_prim_dim_dec).sum()
+            current_prim_dim_dec = (
+                current_prim_dim_dec - sign * self._db_prim_exps[best_result_dim_idx]
+            )
             counter += 1
-        return Dimension(new_dim_dec)
+        return Dimension._from_exps(new_dim_dec)
 
     @property
     def equiv_dim_primary_decomposition(self) -> Dimension:
@@ -351,8 +470,24 @@ class Dimension:
             A new `Dimension` object with the same primary dimension decomposition
             as the current dimension, but composed only of primary dimensions.
         """
-        each_prim_dim_decomposition = self._all_dims_exps.reshape(-1, 1) * self._db_prim_exps
-        total_prim_dim_decomposition = each_prim_dim_decomposition.sum(axis=0)
+        # A copy is returned, so that modifying it can't change the cached object
+        return Dimension._from_exps(
+            self._cached_equiv_dim_primary_decomposition._all_dims_exps.copy()
+        )
+
+    @cached_property
+    def _cached_equiv_dim_primary_decomposition(self) -> Dimension:
+        """
+        Base function used by `equiv_dim_primary_decomposition`, which calculates its value.
+        The object is cached and shared, and thus must not be modified in-place.
+        """
+        # If the current dimension is already composed only of primary dimensions,
+        # its primary dimension decomposition is trivially given by its first 7 exponents.
+        if not self._all_dims_exps[self._prim_dim_count :].any():
+            return Dimension.from_prim_dim_decomposition(
+                self._all_dims_exps[: self._prim_dim_count]
+            )
+        total_prim_dim_decomposition = self._all_dims_exps @ self._db_prim_exps_float
         return Dimension.from_prim_dim_decomposition(total_prim_dim_decomposition)
 
     def equiv_dim_all(self, max_num_dims: int = 5, max_exp: int = 3) -> list[Dimension]:
@@ -374,41 +509,33 @@ class Dimension:
             A list of all equivalent dimensions, as `Dimension` objects.
         """
 
-        # Create an index array of all unique combinations of indices of the available dimensions.
-        # The array will have a shape of (b, n), where b is the binomial coefficient (s, n), where
-        # s is the number of available dimensions in the class database (e.g. size of self._db_names),
-        # and n is the number of primary dimensions, i.e. 7.
-        # With the current number of available dimensions (19), the shape will be (50388, 7).
-        combs = np.array(list(combinations(range(self._db_names.size), self._prim_dim_count)))
-
-        solutions = []
-        # Iterate over all combinations
-        for dim_idxs in combs:
-            try:
-                # Create a matrix of primary dimension decomposition exponents of 7 available dimensions,
-                # transpose the matrix and solve the system of linear equations to get the exponents of those
-                # 7 dimensions that result in the current dimension.
-                solution = np.linalg.solve(
-                    self._db_prim_exps[dim_idxs].T, self.exponents_primary_decomposition
-                )
-                # Create an empty array for storing exponents of all available dimensions
-                all_dims_exps = np.zeros(self._db_names.size)
-                # Assign the solution (i.e. exponents) to the indices corresponding to those dimensions
-                all_dims_exps[dim_idxs] = solution
-                solutions.append(all_dims_exps)
-            # The matrix may be singular, in which case there is no unique solution and numpy throws an error.
-            except np.linalg.LinAlgError:
-                pass
-
-        # Only take those unique solutions where all exponents are integers in the range [-10, 10].
-        solutions = np.array(solutions)
-        int_sols = np.unique(
-            solutions[
-                np.all(solutions == solutions.astype(int), axis=1)
-                * np.all(np.abs(solutions) < max_exp, axis=1)
-            ],
-            axis=0,
+        combs, matrices = self._db_equiv_dim_systems()
+        # Solve all systems of linear equations at once
+        rhs = np.broadcast_to(self.exponents_primary_decomposition, combs.shape)
+        solution = np.linalg.solve(matrices, rhs[..., np.newaxis])[..., 0]
+        # The solutions are only accurate up to floating-point rounding errors; round them, and
+        # note which ones are integers within tolerance (adding 0 turns -0.0 into 0.0).
+        rounded_solution = np.rint(solution) + 0.0
+        is_int_solution = np.all(np.abs(solution - rounded_solution) < 1e-8, axis=1)
+        # Only take those solutions where all exponents are integers smaller than `max_exp` in
+        # absolute value. The exponents of all other dimensions are zero, which only satisfies
+        # the condition when `max_exp` is positive.
+        valid_mask = (
+            is_int_solution & np.all(np.abs(rounded_solution) < max_exp, axis=1) & (max_exp > 0)
         )
+        # Create an empty array for storing exponents of all available dimensions for each
+        # valid solution, and assign the solutions (i.e. exponents) to the indices corresponding
+        # to those dimensions.
+        solutions = np.zeros((np.count_nonzero(valid_mask), self._db_names.size))
+        np.put_along_axis(solutions, combs[valid_mask], rounded_solution[valid_mask], axis=1)
+        # Only take the unique solutions. Rows are compared via their raw bytes, which is much
+        # faster than `np.unique(solutions, axis=0)`; this is exact since all exponents are
+        # rounded and there are no negative zeros. The few unique rows are then sorted
+        # lexicographically, as `np.unique` would do.
+        solution_rows = solutions.view(np.dtype((np.void, solutions.itemsize * solutions.shape[1])))
+        _, unique_idx = np.unique(solution_rows.ravel(), return_index=True)
+        int_sols = solutions[unique_idx]
+        int_sols = int_sols[np.lexsort(int_sols.T[::-1])]
         # Filter out the equivalent dimensions that are exactly the same as the current dimension
         int_sols_not_self = int_sols[
             np.logical_not(np.all((int_sols == self.exponents_as_is), axis=1))
@@ -463,17 +590,16 @@ class Dimension:
             raise ValueError(
                 "Argument `dimension` should either be a string or a `Dimension` object."
             )
-        # Divide dimensions and take the primary dimension decomposition of the result
-        dim_diff = (dimension / self).exponents_primary_decomposition
-        # Get the index of 'amount of substance' dimension
-        idx_amount_of_subst_dim = np.argwhere(self._db_symbols == "N")[0, 0]
+        # Take the difference between the (cached) primary dimension decompositions,
+        # which is the primary dimension decomposition of the division of the two dimensions
+        dim_diff = dimension.exponents_primary_decomposition - self.exponents_primary_decomposition
         # Note the exponent of the 'amount of substance' dimension
-        dim_n_diff = dim_diff[idx_amount_of_subst_dim]
+        dim_n_diff = dim_diff[self._db_amount_of_subst_idx]
         # Now set it to zero and check if all exponents are now zero
-        dim_diff[idx_amount_of_subst_dim] = 0
+        dim_diff[self._db_amount_of_subst_idx] = 0
         # The unit is only convertible if all exponents of the division result is zero
         # not considering the 'amount of substance'.
-        is_convertible = np.all(dim_diff == 0)
+        is_convertible = not dim_diff.any()
         if return_n_factor:
             return is_convertible, dim_n_diff
         else:
@@ -489,15 +615,17 @@ class PredefinedDimensions:
     """
 
     def __init__(self):
-        def dim_gen(self, symbol):
-            return Dimension(symbol)
+        def dim_gen(self, all_dims_exps):
+            return Dimension._from_exps(all_dims_exps.copy())
 
         init_dict = primary | derived
         for name, data in init_dict.items():
+            # Parse each symbol only once, and only copy the exponents on each access
+            all_dims_exps = Dimension(data["symbol"])._all_dims_exps
             setattr(
                 PredefinedDimensions,
                 name,
-                property(partial(dim_gen, symbol=data["symbol"])),
+                property(partial(dim_gen, all_dims_exps=all_dims_exps)),
             )
 
 
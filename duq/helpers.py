@@ -5,6 +5,7 @@ Helper functions used in other modules.
 # Standard library
 from typing import Tuple, Union, Sequence, Type
 from fractions import Fraction
+from functools import lru_cache
 
 # 3rd-party
 import numpy as np
@@ -12,14 +13,19 @@ import numpy as np
 # Self
 from .data.unicode_chars import superscript_chars
 
+# Translation table for turning the string representation of a number into superscript
+_superscript_table = str.maketrans(superscript_chars)
 
-def parse_base_with_exp_string(string: str) -> Tuple[np.ndarray, np.ndarray]:
+
+@lru_cache(maxsize=1024)
+def parse_base_with_exp_string(string: str) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
     """
     Parse a string representation of a collection of bases and exponents,
     seperated from each other by a '.' symbol. Each base may be followed
     by a `^` symbol, separating it from its exponent. The exponent should
     either be an integer, or a fraction where the nominator and denominator
     are separated by a `/` symbol.
+    Results are cached, since the same strings are usually parsed repeatedly.
 
     Parameters
     ----------
@@ -28,38 +34,57 @@ def parse_base_with_exp_string(string: str) -> Tuple[np.ndarray, np.ndarray]:
 
     Returns
     -------
-        tuple[numpy.ndarray, numpy.ndarray]
+        tuple[tuple, tuple]
+        Tuples of bases, and their corresponding exponents. Since the results are cached
+        and shared between calls, these are immutable tuples, and not lists.
 
     Examples
     --------
-    "kg.m^2.s^-2" -> (["kg", "m", "s"], [1, 2, -2])
-    "m^3/2" -> (["m"], [1.5])
+    "kg.m^2.s^-2" -> (("kg", "m", "s"), (1, 2.0, -2.0))
+    "m^3/2" -> (("m",), (1.5,))
     """
 
     bases = []
     exps = []
-    terms_list = string.split(".")
-    for term in terms_list:
-        base_and_exp = term.split("^")
-        len_term = len(base_and_exp)
-        if len_term == 0:
-            raise ValueError("Consecutive '.' symbols are not allowed.")
-        elif len_term == 1:
+    # Scan the string from left to right, one term (i.e. up to the next '.' symbol) at a time
+    len_string = len(string)
+    term_start = 0
+    while True:
+        term_end = string.find(".", term_start)
+        if term_end == -1:
+            term_end = len_string
+        exp_sep_idx = string.find("^", term_start, term_end)
+        if exp_sep_idx == -1:
+            bases.append(string[term_start:term_end])
             exps.append(1)
-        elif len_term == 2:
-            exps.append(float(Fraction(base_and_exp[1])))
-        else:
+        elif string.find("^", exp_sep_idx + 1, term_end) != -1:
             raise ValueError(
                 "Only one '^' symbol may appear for each term (i.e. between two '.' symbols)."
             )
-        bases.append(base_and_exp[0])
-    bases = np.array(bases)
-    exps = np.array(exps)
-    return bases, exps
+        else:
+            bases.append(string[term_start:exp_sep_idx])
+            exps.append(_parse_exp(string[exp_sep_idx + 1 : term_end]))
+        if term_end == len_string:
+            break
+        term_start = term_end + 1
+    return tuple(bases), tuple(exps)
+
+
+@lru_cache(maxsize=256)
+def _parse_exp(exp: str) -> float:
+    """
+    Turn the string representation of an exponent, i.e. an integer, or a fraction
+    where the nominator and denominator are separated by a `/` symbol, into a number.
+    Results are cached, since only a small set of exponents appear in practice.
+    """
+    return float(Fraction(exp))
 
 
 def generate_symbol_for_base_exp_series(
-    base_array: np.ndarray, exp_array: np.ndarray, seperator: str = ""
+    base_array: Union[Sequence, np.ndarray],
+    exp_array: Union[Sequence, np.ndarray],
+    seperator: str = "",
+    nested_bases: bool = True,
 ) -> str:
     """
     Take two arrays representing the bases and exponents of an expression,
@@ -70,29 +95,38 @@ def generate_symbol_for_base_exp_series(
 
     Parameters
     ----------
-    base_array : numpy.ndarray
+    base_array : Union[Sequence, numpy.ndarray]
         Array representing the bases.
-    exp_array : numpy.ndarray
+    exp_array : Union[Sequence, numpy.ndarray]
         Array representing the exponents
     seperator : str
         Separator to be printed in between base-exponent pairs.
+    nested_bases : bool (optional; default: True)
+        Whether bases may themselves be expressions, i.e. contain '.' or '^' symbols,
+        in which case they are pretty-printed in parentheses. Setting this to False
+        skips the check, when all bases are known to be simple.
 
     Returns
     -------
         str
         String representation of the expression.
     """
-    nonzero_exp_mask = exp_array != 0
-    nonzero_exps = exp_array[nonzero_exp_mask]
-    bases_of_nonzero_exps = base_array[nonzero_exp_mask]
+    # Iterating over Python lists is much faster than over NumPy arrays of this size
+    if isinstance(base_array, np.ndarray):
+        base_array = base_array.tolist()
+    if isinstance(exp_array, np.ndarray):
+        exp_array = exp_array.tolist()
+    nonzero_terms = [(base, exp) for base, exp in zip(base_array, exp_array) if exp != 0]
+    bases_of_nonzero_exps = [base for base, _ in nonzero_terms]
+    nonzero_exps = [exp for _, exp in nonzero_terms]
     pretty_string_representation = pretty_print_base_with_exp_series(
-        bases_of_nonzero_exps, nonzero_exps, seperator
+        bases_of_nonzero_exps, nonzero_exps, seperator, nested_bases
     )
     return pretty_string_representation
 
 
 def pretty_print_base_with_exp_series(
-    base_array: Sequence, exp_array: Sequence, seperator: str = ""
+    base_array: Sequence, exp_array: Sequence, seperator: str = "", nested_bases: bool = True
 ) -> str:
     """
     Create a string representation of a collection of bases and their corresponding exponents,
@@ -106,6 +140,10 @@ def pretty_print_base_with_exp_series(
         Collection of exponents
     seperator : str
         A character or a string to separate base-exponent pairs from each other.
+    nested_bases : bool (optional; default: True)
+        Whether bases may themselves be expressions, i.e. contain '.' or '^' symbols,
+        in which case they are pretty-printed in parentheses. Setting this to False
+        skips the check, when all bases are known to be simple.
 
     Returns
     -------
@@ -117,34 +155,26 @@ def pretty_print_base_with_exp_series(
     (base_array=["L", "M", "T"], exp_array=[1, 2, -2]) -> "LM²T⁻²"
     (base_array=["length", "mass", "time"], exp_array=[1, 2, -2], seperator=".") -> "length.mass².time⁻²"
     """
-    base_array = np.array(base_array)
-
-    for idx, base in enumerate(base_array):
-        if "." in base or "^" in base:
-            base_array_, exp_array_ = parse_base_with_exp_string(base)
-            base_array[
-                idx
-            ] = f"({pretty_print_base_with_exp_series(base_array_, exp_array_, '.')})"
-
-    exp_array = np.array(exp_array)
-    if base_array.size == 0:
+    if len(base_array) == 0:
         return "empty"
-    else:
-        seperator_array = np.full(exp_array.size, seperator)
-        seperator_array[-1] = ""
-        superscripted_exps = np.array(list(map(superscript_map_func, exp_array)))
-        superscripted_exps_with_seperator = np.core.defchararray.add(
-            superscripted_exps, seperator_array
-        )
-        full_expression_array = np.core.defchararray.add(
-            base_array, superscripted_exps_with_seperator
+    if not nested_bases:
+        return seperator.join(
+            [f"{base}{superscript_map_func(exp)}" for base, exp in zip(base_array, exp_array)]
         )
-        return "".join(full_expression_array)
+    terms = []
+    for base, exp in zip(base_array, exp_array):
+        if "." in base or "^" in base:
+            base_array_, exp_array_ = parse_base_with_exp_string(base)
+            base = f"({pretty_print_base_with_exp_series(base_array_, exp_array_, '.')})"
+        terms.append(f"{base}{superscript_map_func(exp)}")
+    return seperator.join(terms)
 
 
+@lru_cache(maxsize=256)
 def superscript_map_func(exp: Union[int, float]) -> str:
     """
     Turn a number into its superscript string form.
+    Results are cached, since only a small set of exponents appear in practice.
     """
     if exp == 1:
         exp_reduced_str = ""
@@ -152,7 +182,7 @@ def superscript_map_func(exp: Union[int, float]) -> str:
         exp_reduced_str = str(int(exp))
     else:
         exp_reduced_str = str(Fraction(exp).limit_denominator())
-    return "".join([superscript_chars[char] for char in exp_reduced_str])
+    return exp_reduced_str.translate(_superscript_table)
 
 
 def raise_for_type(
@@ -191,6 +221,37 @@ def order_for_repr(
     """
     Re-order each sub-array (not in-place) in an array of arrays.
     Each subarray is reordered based on priority of dimensions/units for
+    generating name and symbol representations; see `indices_for_repr`.
+
+    Parameters
+    ----------
+    arrays : Union[Sequence[Union[Sequence, np.ndarray]], np.ndarray]
+        An array containing the arrays to be ordered.
+    cut_idx : int
+        Index used to slice the array into two.
+        This should be the index of the first derived dimension/unit in the array.
+
+    Returns
+    -------
+    ordered_arrays : list
+        List of ordered arrays.
+
+    Examples
+    --------
+    ([[a,b,c,d,e,f]], 3) -> [[f,e,d,a,b,c]]
+    """
+    ordered_indices = indices_for_repr(len(arrays[0]), cut_idx)
+    # Reorder arrays using the calculated index array.
+    ordered_arrays = []
+    for array in arrays:
+        ordered_arrays.append(array[ordered_indices])
+    return ordered_arrays
+
+
+def indices_for_repr(size: int, cut_idx: int) -> np.ndarray:
+    """
+    Calculate the indices for re-ordering an array of dimensions/units
+    (or their corresponding data), based on priority of dimensions/units for
     generating name and symbol representations.
     The priority is set as follows:
         1. Derived dimensions/units before primary dimensions/units
@@ -200,27 +261,28 @@ def order_for_repr(
     that the primary dimensions/units are first (in the conventional order),
     followed by derived dimensions/units, going from simple ones to more complex ones.
     Thus, for reordering, only the index of the first derived dimension/unit is needed.
+    Since the result only depends on the size of the database, it can be calculated once
+    and reused for all re-orderings.
 
     Parameters
     ----------
-    arrays : Union[Sequence[Union[Sequence, np.ndarray]], np.ndarray]
-        An array containing the arrays to be ordered.
+    size : int
+        Size of the arrays to be ordered.
     cut_idx : int
         Index used to slice the array into two.
         This should be the index of the first derived dimension/unit in the array.
 
     Returns
     -------
-    ordered_arrays : list
-        List of ordered arrays.
+    ordered_indices : numpy.ndarray
+        Array of indices, which re-orders an array when used for indexing it.
 
     Examples
     --------
-    ([[a,b,c,d,e,f]], 3) -> [[f,e,d,a,b,c]]
+    (6, 3) -> [5, 4, 3, 0, 1, 2]
     """
-
     # Calculate indices of the reordered array
-    indices = np.arange(len(arrays[0]))
+    indices = np.arange(size)
     ordered_indices = np.concatenate(
         (  # Take the derived dimensions and flip them
             # since in the original database, derived dimensions
@@ -231,8 +293,4 @@ def order_for_repr(
             indices[:cut_idx],
         )
     )
-    # Reorder arrays using the calculated index array.
-    ordered_arrays = []
-    for array in arrays:
-        ordered_arrays.append(array[ordered_indices])
-    return ordered_arrays
+    return ordered_indices
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Union, Tuple, Optional
+import math
+from typing import Union, Tuple, Optional, Sequence
 from functools import partial
 
 import numpy as np
@@ -7,6 +8,7 @@ import numpy as np
 from .unit import Unit
 from .dimension import Dimension
 from .helpers import raise_for_type
+from ._kernels import affine_transform as affine_transform_kernel
 from .data.physical_constants import phys_consts
 
 
@@ -20,8 +22,11 @@ class Quantity:
 
     Parameters
     ----------
-    value : Union[int, float, numpy.number]
+    value : Union[int, float, numpy.number, numpy.ndarray]
         The numerical value of the physical quantity.
+        If a numpy array, the quantity represents a collection of values with the same unit;
+        all arithmetic operations and unit conversions are then applied to the whole array
+        at once. Normalization is not supported for array values.
     unit : Union[str, unit.Unit]
         The unit of the physical quantity.
         If a string, it may be composed of a number of units, separated
@@ -35,8 +40,17 @@ class Quantity:
         and add the resulting exponent to the unit.
         Example:
         1234 g will be transformed into 1.234 kg.
+
+    Notes
+    -----
+    The class defines `__slots__`, so subclasses adding new attributes
+    should also define `__slots__` to keep instances free of a `__dict__`.
     """
 
+    __slots__ = ("_value", "_unit", "_normalization")
+    # Minimum size of array values for which unit conversions use the compiled kernel
+    _kernel_min_size: int = 10_000
+
     @classmethod
     def supported_input_units(cls) -> Tuple:
         """
@@ -45,18 +59,76 @@ class Quantity:
         """
         return Unit.supported_input_units()
 
+    @classmethod
+    def from_array(cls, values: Union[Sequence, np.ndarray], unit: Union[str, Unit]) -> Quantity:
+        """
+        Alternative factory method to construct a Quantity object representing
+        a collection of values with the same unit, from an array-like of numbers.
+        This is much faster than creating a separate Quantity object for each value.
+
+        Parameters
+        ----------
+        values : Union[Sequence, numpy.ndarray]
+            Array-like of numbers, representing the values of the physical quantity.
+        unit : Union[str, unit.Unit]
+            The unit of the physical quantity; see `Quantity`.
+
+        Returns
+        -------
+            Quantity
+        """
+        return cls(np.asarray(values), unit)
+
+    @classmethod
+    def _from_value_and_unit(
+        cls, value: Union[int, float, np.number, np.ndarray], unit: Unit
+    ) -> Quantity:
+        """
+        Construct a Quantity object directly from a value and a `Unit` object,
+        without any validation, and with normalization turned off.
+        For internal use only, when both the value and the unit are known to be valid.
+
+        Parameters
+        ----------
+        value : Union[int, float, numpy.number, numpy.ndarray]
+            The numerical value of the physical quantity.
+        unit : unit.Unit
+            The unit of the physical quantity.
+
+        Returns
+        -------
+            Quantity
+        """
+        quantity = cls.__new__(cls)
+        quantity._value = value
+        quantity._unit = unit
+        quantity._normalization = False
+        return quantity
+
     def __init__(
         self,
-        value: Union[int, float, np.number],
+        value: Union[int, float, np.number, np.ndarray],
         unit: Union[str, Unit],
         normalization: bool = False,
     ):
 
         # Verify the type of `value` and assign if correct.
-        if isinstance(value, (int, float, np.number)):
+        # Plain floats and ints are checked first by exact type, which is cheaper than
+        # `isinstance` checks against a tuple of types.
+        value_type = type(value)
+        if value_type is float or value_type is int:
+            self._value = value
+        elif isinstance(value, (int, float, np.number)):
+            self._value = value
+        elif isinstance(value, np.ndarray):
+            # Signed integers, unsigned integers and floats
+            if value.dtype.kind not in "iuf":
+                raise ValueError("All elements of the `value` array must be numbers.")
             self._value = value
         else:
-            raise ValueError("Type of `value` should either be int, float, or numpy.number.")
+            raise ValueError(
+                "Type of `value` should either be int, float, numpy.number, or numpy.ndarray."
+            )
 
         # Verify the type of `unit` and assign if correct.
         if isinstance(unit, str):
@@ -91,26 +163,25 @@ class Quantity:
             Quantity,
             "Comparison can only be performed on two `Quantity` objects.",
         )
-        other_in_self_units = other.convert_unit(self.unit)
-        return other_in_self_units
+        return other._value_in_unit(self._unit)
 
     def __eq__(self, other: Quantity):
-        other_in_self_units = self.__compare_common__(other)
-        return np.isclose(self.value, other_in_self_units.value)
+        other_value_in_self_units = self.__compare_common__(other)
+        return np.isclose(self._value, other_value_in_self_units)
 
     def __lt__(self, other):
-        other_in_self_units = self.__compare_common__(other)
-        return self.value < other_in_self_units.value
+        other_value_in_self_units = self.__compare_common__(other)
+        return self._value < other_value_in_self_units
 
     def __le__(self, other):
-        return self.__lt__(other) or self.__eq__(other)
+        return np.logical_or(self.__lt__(other), self.__eq__(other))
 
     def __gt__(self, other):
-        other_in_self_units = self.__compare_common__(other)
-        return self.value > other_in_self_units.value
+        other_value_in_self_units = self.__compare_common__(other)
+        return self._value > other_value_in_self_units
 
     def __ge__(self, other):
-        return self.__gt__(other) or self.__eq__(other)
+        return np.logical_or(self.__gt__(other), self.__eq__(other))
 
     def __add_common__(self, other, sign):
         # Common operations between __add__, __sub__, __iadd__ and __isub__
@@ -119,19 +190,16 @@ class Quantity:
             Quantity,
             "Addition can only be performed on another PhysicalQuantity object.",
         )
-        if other.unit == self.unit:
-            new_value = self.value + sign * other.value
-        else:
-            try:
-                other_in_self_units = other.convert_unit(self.unit)
-                new_value = self.value + sign * other_in_self_units.value
-            except ValueError:
-                raise ValueError("Addends' units are not interconvertible.")
+        try:
+            other_value_in_self_units = other._value_in_unit(self._unit)
+        except ValueError:
+            raise ValueError("Addends' units are not interconvertible.")
+        new_value = self._value + sign * other_value_in_self_units
         return new_value
 
     def __add__(self, other):
         new_value = self.__add_common__(other, 1)
-        return Quantity(new_value, self.unit)
+        return Quantity._from_value_and_unit(new_value, self._unit)
 
     def __radd__(self, other):
         raise NotImplementedError(
@@ -146,7 +214,7 @@ class Quantity:
 
     def __sub__(self, other):
         new_value = self.__add_common__(other, -1)
-        return Quantity(new_value, self.unit)
+        return Quantity._from_value_and_unit(new_value, self._unit)
 
     def __rsub__(self, other):
         raise NotImplementedError(
@@ -160,12 +228,12 @@ class Quantity:
         return self
 
     def __mul_common__(self, other):
-        if isinstance(other, (int, float)):
-            new_value = self.value * other
-            new_unit = self.unit
-        elif isinstance(other, Quantity):
-            new_value = self.value * other.value
-            new_unit = self.unit * other.unit
+        if isinstance(other, Quantity):
+            new_value = self._value * other._value
+            new_unit = self._unit * other._unit
+        elif isinstance(other, (int, float)):
+            new_value = self._value * other
+            new_unit = self._unit
         else:
             raise NotImplementedError(
                 "Multiplicand should either be int, float, or a PhysicalQuantity object."
@@ -174,7 +242,7 @@ class Quantity:
 
     def __mul__(self, other):
         new_value, new_unit = self.__mul_common__(other)
-        return Quantity(new_value, new_unit)
+        return Quantity._from_value_and_unit(new_value, new_unit)
 
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -186,8 +254,8 @@ class Quantity:
         return self
 
     def __pow_common__(self, power):
-        new_value = self.value ** power
-        new_unit = self.unit ** power
+        new_value = self._value ** power
+        new_unit = self._unit ** power
         return new_value, new_unit
 
     def __pow__(self, power):
@@ -201,12 +269,12 @@ class Quantity:
         return self
 
     def __truediv_common__(self, other):
-        if isinstance(other, (int, float)):
-            new_value = self.value / other
-            new_unit = self.unit
-        elif isinstance(other, Quantity):
-            new_value = self.value / other.value
-            new_unit = self.unit / other.unit
+        if isinstance(other, Quantity):
+            new_value = self._value / other._value
+            new_unit = self._unit / other._unit
+        elif isinstance(other, (int, float)):
+            new_value = self._value / other
+            new_unit = self._unit
         else:
             raise NotImplementedError(
                 "Dividend should either be int, float, or a PhysicalQuantity object."
@@ -215,7 +283,7 @@ class Quantity:
 
     def __truediv__(self, other):
         new_value, new_unit = self.__truediv_common__(other)
-        return Quantity(new_value, new_unit)
+        return Quantity._from_value_and_unit(new_value, new_unit)
 
     def __rtruediv__(self, other):
         new_quant = self.__pow__(-1)
@@ -229,18 +297,28 @@ class Quantity:
 
     @property
     def str_repr_short(self):
-        # Transform value into string in scientific notation with 10 decimals
-        val_sci_not = "{:.10E}".format(self.value)
-        # Separate mantissa and exponent
-        mantissa, exp = val_sci_not.split("E")
-        # Strip mantissa of trailing zeros
-        zero_stripped_mantissa = mantissa.rstrip("0").rstrip(".")
-        # Reformat into scientific notation string, by adding 'E' and exponent at the end
-        zero_stripped_val_sci_not = zero_stripped_mantissa + "E" + exp
-        return f"{zero_stripped_val_sci_not} {self.unit.symbol_as_is}"
+        if isinstance(self.value, np.ndarray):
+            value_str = np.array2string(
+                self.value, separator=", ", formatter={"all": self._str_repr_number}
+            )
+        else:
+            value_str = self._str_repr_number(self.value)
+        return f"{value_str} {self.unit.symbol_as_is}"
+
+    @staticmethod
+    def _str_repr_number(value: Union[int, float, np.number]) -> str:
+        """
+        String representation of a number in scientific notation with up to 10 decimals.
+        """
+        # Transform value into scientific notation with 10 decimals, and separate the mantissa
+        # and exponent, in order to strip the mantissa of trailing zeros.
+        # Note: the 'g' format specifier can't be used, since it only uses scientific notation
+        # for large and small exponents.
+        mantissa, exp = f"{value:.10E}".split("E")
+        return f"{mantissa.rstrip('0').rstrip('.')}E{exp}"
 
     @property
-    def value(self) -> Union[int, float, np.number]:
+    def value(self) -> Union[int, float, np.number, np.ndarray]:
         """
         The numerical value of the physical quantity.
         """
@@ -250,6 +328,8 @@ class Quantity:
     def unit(self) -> Unit:
         """
         unit.Unit object representing the unit of the quantity.
+        The same object may be shared with other quantities (e.g. results of arithmetic
+        operations and predefined constants), and thus should not be modified in-place.
         """
         return self._unit
 
@@ -314,17 +394,20 @@ class Quantity:
         --------
         1234 g will be transformed into 1.234 kg.
         """
-
+        if isinstance(self._value, np.ndarray):
+            raise ValueError("Normalization is not supported for quantities with array values.")
         # Calculate the exponent of the value, when the value
         # is written with a mantissa in the range [1,10).
-        exp = int(np.floor(np.log10(abs(self.value))))
+        # Since the value is a scalar, `math` is used, which is much faster than NumPy.
+        # A value of zero has no such exponent, and is left unchanged.
+        exp = math.floor(math.log10(abs(self._value))) if self._value != 0 else 0
         # Update value and unit accordingly
         new_value = self._value * (10 ** -exp) if exp != 0 else self._value
-        new_unit = self.unit.modify_prefix(exp, inplace=False) if exp != 0 else self.unit
+        new_unit = self._unit.modify_prefix(exp, inplace=False) if exp != 0 else self._unit
         if inplace:
             self._value, self._unit = new_value, new_unit
         else:
-            return Quantity(new_value, new_unit)
+            return Quantity._from_value_and_unit(new_value, new_unit)
 
     def convert_unit_to_si(self, inplace: bool = False) -> Optional[Quantity]:
         """
@@ -341,7 +424,7 @@ class Quantity:
             If `inplace` it True, returns None;
             If False, a new PhysicalQuantity object is returned.
         """
-        return self._convert_unit(self.unit.convert_to_si, inplace)
+        return self._convert_unit(self._unit.convert_to_si, inplace)
 
     def convert_unit(
         self, new_unit: Union[str, Unit], inplace: bool = False
@@ -362,7 +445,43 @@ class Quantity:
             If `inplace` it True, returns None;
             If False, a new PhysicalQuantity object is returned.
         """
-        return self._convert_unit(self.unit.convert_to(new_unit), inplace)
+        return self._convert_unit(self._unit.convert_to(new_unit), inplace)
+
+    def _value_in_unit(self, unit: Unit) -> Union[int, float, np.number, np.ndarray]:
+        """
+        Value of the quantity in another unit, without creating a new `Quantity` object.
+        Used in comparison and addition operations; the conversion coefficients between
+        each pair of units are cached in `Unit.conversion_coefficients_to`.
+        """
+        # The value is returned untouched (and thus keeps its type, e.g. int) when the units
+        # are exactly the same. `Unit.__eq__` is not used here, since it is only approximate.
+        if (
+            unit is self._unit
+            or unit._all_units_exps.tobytes() == self._unit._all_units_exps.tobytes()
+        ):
+            return self._value
+        conv_shift, conv_factor = self._unit.conversion_coefficients_to(unit)
+        # The same goes for units that convert exactly into each other, e.g. J and kg.m^2.s^-2
+        if conv_shift == 0 and conv_factor == 1:
+            return self._value
+        return self._converted_value(conv_shift, conv_factor)
+
+    def _converted_value(
+        self, conv_shift: float, conv_factor: float
+    ) -> Union[int, float, np.number, np.ndarray]:
+        """
+        Apply the conversion coefficients to the value, i.e. `(value + shift) * factor`.
+        For large float64 arrays, the compiled kernel is used when Numba is available,
+        which does this in a single parallel pass without creating an intermediate array.
+        """
+        if (
+            affine_transform_kernel is not None
+            and isinstance(self._value, np.ndarray)
+            and self._value.dtype == np.float64
+            and self._value.size >= self._kernel_min_size
+        ):
+            return affine_transform_kernel(self._value, conv_shift, conv_factor)
+        return (self._value + conv_shift) * conv_factor
 
     def _convert_unit(
         self, conversion_results: Tuple[float, float, Unit], inplace: bool
@@ -371,12 +490,12 @@ class Quantity:
         Base function used by both `convert_unit` and `convert_unit_to_si` functions.
         """
         conv_shift, conv_factor, new_unit = conversion_results
-        new_value = (self._value + conv_shift) * conv_factor
+        new_value = self._converted_value(conv_shift, conv_factor)
         if inplace:
             self._value = new_value
             self._unit = new_unit
         else:
-            return Quantity(new_value, new_unit)
+            return Quantity._from_value_and_unit(new_value, new_unit)
 
 
 class PhysicalConstants:
@@ -388,13 +507,20 @@ class PhysicalConstants:
 
     def __init__(self, phys_consts_dict):
         def const_gen(self, value, unit):
-            return Quantity(value, Unit(unit))
+            # Units are mutable, so each returned `Quantity` gets its own copy of the unit
+            unit_copy = Unit._from_exps_and_dim(
+                unit._all_units_exps.copy(),
+                Dimension._from_exps(unit._dimension._all_dims_exps.copy()),
+            )
+            return Quantity._from_value_and_unit(value, unit_copy)
 
         for const_name, data in phys_consts_dict.items():
+            # Parse each unit only once; the parsed `Unit` object is kept private,
+            # and only copied on each access.
             setattr(
                 PhysicalConstants,
                 const_name,
-                property(partial(const_gen, value=data["value"], unit=data["unit"])),
+                property(partial(const_gen, value=data["value"], unit=Unit(data["unit"]))),
             )
 
 
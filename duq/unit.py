@@ -1,14 +1,16 @@
 from __future__ import annotations
 from typing import Tuple, Sequence, Union
+from functools import lru_cache, cached_property
 
 import numpy as np
 
 from .dimension import Dimension
-from .data.dimensions_units import primary, derived
-from .data.physical_constants import phys_consts
+from .data.dimensions_units import primary, derived, units
+from .data.physical_constants import phys_const
 from .helpers import parse_base_with_exp_string as parse_base_exp
 from .helpers import generate_symbol_for_base_exp_series as gen_symbol
-from .helpers import raise_for_type, order_for_repr
+from .helpers import raise_for_type, indices_for_repr
+from ._kernels import conversion_coefficients as conversion_coefficients_kernel
 
 
 __all__ = ("Unit", "predefined")
@@ -48,47 +50,65 @@ class Unit:
         which accepts a sequence of 7 numbers, corresponding to the exponents of the
         primary-unit-decomposition of the desired dimension, in the order:
         [kilogram, metre, second, ampere, kelvin, mole, candela]
+
+    Notes
+    -----
+    The class defines `__slots__`, so subclasses adding new attributes
+    should also define `__slots__` to keep instances free of a `__dict__`.
     """
 
+    # The last three attributes hold the cached values of the corresponding properties
+    __slots__ = (
+        "_all_units_exps",
+        "_dimension",
+        "_equiv_unit_si",
+        "_equiv_unit_si_primary",
+        "_conversion_coefficients_to_si",
+    )
+
     # --- Initialize class attributes ---
     # Number of primary units - to use as reference for slicing
     _prim_unit_count: int = sum([len(dim["units"].keys()) for dim in primary.values()])
     # Dictionary containing all units and dimensions info
     _db_all: dict = primary | derived
     # Name of units
-    _db_names = np.array(
-        [unit["name"] for dim in _db_all.values() for unit in dim["units"].values()]
-    )
+    _db_names = np.ascontiguousarray(units["name"])
     # Symbol of units
-    _db_symbols = np.array(
-        [unit["symbol"] for dim in _db_all.values() for unit in dim["units"].values()]
-    )
+    _db_symbols = np.ascontiguousarray(units["symbol"])
+    # Mapping of each name and symbol in the database to the index of its unit
+    _db_idx: dict = {name: idx for idx, name in enumerate(_db_names.tolist())} | {
+        symbol: idx for idx, symbol in enumerate(_db_symbols.tolist())
+    }
     # Conversion factor of units (to SI unit)
-    _db_conv_factors = np.array(
-        [unit["conv_factor"] for dim in _db_all.values() for unit in dim["units"].values()]
-    )
+    _db_conv_factors = np.ascontiguousarray(units["conv_factor"])
     # Prefix exponent of each unit (e.g. for kg = 3, for g = 0)
-    _db_prefix_exp = np.array(
-        [unit["prefix_exp"] for dim in _db_all.values() for unit in dim["units"].values()]
-    )
+    _db_prefix_exp = np.ascontiguousarray(units["prefix_exp"])
     # Number of available dimensions
     _dims_count: int = len(_db_all.keys())
-    # Name of the dimension of each available unit
-    # (each name is repeated as many times as there are units in that dim)
-    _db_dim_names = np.array(
-        [dim["name"] for dim in _db_all.values() for unit in dim["units"].values()]
-    )
     # Index of the dimension of each available unit
     # (each index is repeated as many times as there are units in that dim)
-    _db_dims_idx = np.array(
-        [idx for idx, dim in enumerate(_db_all.values()) for unit in dim["units"].values()]
-    )
+    _db_dims_idx = np.ascontiguousarray(units["dim_idx"])
+    # Name of the dimension of each available unit
+    # (each name is repeated as many times as there are units in that dim)
+    _db_dim_names = np.array([dim["name"] for dim in _db_all.values()])[_db_dims_idx]
+    # Indices of temperature units, which are the only units with conversion shifts
+    # instead of conversion factors, and the shifts themselves
+    _db_temp_units_idx = np.flatnonzero(_db_dim_names == "temperature")
+    _db_temp_conv_shifts = _db_conv_factors[_db_temp_units_idx]
+    # Mask and indices of all other units, and their conversion factors
+    _db_non_temp_units_mask = _db_dim_names != "temperature"
+    _db_non_temp_units_idx = np.flatnonzero(_db_non_temp_units_mask)
+    _db_non_temp_conv_factors = _db_conv_factors[_db_non_temp_units_idx]
     _, _db_si_units_idx, _db_dim_units_counts = np.unique(
         _db_dims_idx, return_index=True, return_counts=True
     )
     # Index of the SI unit for each unit (repeated as many times as there are units with the same SI unit)
     _db_si_units_idx_all = np.repeat(_db_si_units_idx, _db_dim_units_counts)
     del _
+    # Indices of all units that are not SI units
+    _db_non_si_units_idx = np.flatnonzero(np.arange(_db_names.size) != _db_si_units_idx_all)
+    # Indices for re-ordering units for name and symbol representations
+    _db_repr_order: np.ndarray = indices_for_repr(_db_names.size, _prim_unit_count)
 
     @classmethod
     def supported_input_units(cls) -> Tuple:
@@ -138,19 +158,48 @@ class Unit:
         all_units_exps[cls._db_si_units_idx] = dimension.exponents_as_is
         return cls(all_units_exps)
 
+    @classmethod
+    def _from_exps_and_dim(cls, all_units_exps: np.ndarray, dimension: Dimension) -> Unit:
+        """
+        Construct a Unit object directly from an array of exponents of all units and its
+        corresponding Dimension object, without any validation and without copying.
+        For internal use only; the array must be a new float64 array with the same shape as
+        `_db_names`, and the dimension a new Dimension object, neither of which is shared with
+        any other object.
+
+        Parameters
+        ----------
+        all_units_exps : numpy.ndarray
+            Exponents of all units in the database.
+        dimension : Dimension
+            Dimension of the unit.
+
+        Returns
+        -------
+            Unit
+        """
+        unit = cls.__new__(cls)
+        unit._all_units_exps = all_units_exps
+        unit._dimension = dimension
+        unit._clear_cached_properties()
+        return unit
+
+    def _copy(self) -> Unit:
+        """
+        Construct a new Unit object with copies of the exponents and the dimension of the unit.
+        """
+        return Unit._from_exps_and_dim(
+            self._all_units_exps.copy(), Dimension._from_exps(self._dimension._all_dims_exps.copy())
+        )
+
     def __init__(self, unit):
-        self._all_units_exps = np.zeros(self._db_symbols.size)
         if isinstance(unit, str):
             if unit == "":
                 raise ValueError("Unit input is an empty string.")
             else:
-                units, exps = parse_base_exp(unit)
-                for unit, exp in zip(units, exps):
-                    mask = (self._db_symbols == unit) + (self._db_names == unit)
-                    if np.any(mask):
-                        self._all_units_exps[mask] += exp
-                    else:
-                        raise ValueError(f"Unit {unit} not recognized.")
+                units_exps, dims_exps = self._units_exps_from_string(unit)
+                self._all_units_exps = units_exps.copy()
+                unit_dims = dims_exps.copy()
         elif isinstance(unit, (list, np.ndarray)):
             all_units_exps = np.array(unit)
             if all_units_exps.shape != self._db_symbols.shape:
@@ -160,7 +209,9 @@ class Unit:
             ):
                 raise ValueError("All elements of the `unit` array must be numbers.")
             else:
-                self._all_units_exps[...] = all_units_exps
+                # `all_units_exps` is already a new array, and is only copied for casting
+                self._all_units_exps = all_units_exps.astype(np.float64, copy=False)
+                unit_dims = self._dims_exps_from_units_exps(self._all_units_exps)
         elif isinstance(unit, Dimension):
             raise ValueError(
                 "For instantiation using a `Dimension` object, use Unit.from_dimension_object."
@@ -169,9 +220,36 @@ class Unit:
             raise ValueError(
                 "Argument of `unit` should either be a string or array-like of numbers."
             )
-        unit_dims = np.zeros(self._dims_count)
-        np.add.at(unit_dims, self._db_dims_idx, self._all_units_exps)
-        self._dimension = Dimension(unit_dims)
+        self._dimension = Dimension._from_exps(unit_dims)
+        self._clear_cached_properties()
+
+    @staticmethod
+    def _dims_exps_from_units_exps(all_units_exps: np.ndarray) -> np.ndarray:
+        """
+        Calculate the exponents of all dimensions from the exponents of all units.
+        """
+        return np.bincount(Unit._db_dims_idx, weights=all_units_exps, minlength=Unit._dims_count)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _units_exps_from_string(unit: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Base function used by `__init__`, which calculates the exponents of all units in the
+        database, as well as those of all dimensions, from the string representation of a unit.
+        Since the exponents only depend on the string, the results are cached (as read-only
+        arrays, which are copied into each new object), so that each string is only parsed once.
+        """
+        all_units_exps = np.zeros(Unit._db_symbols.size)
+        units, exps = parse_base_exp(unit)
+        for unit, exp in zip(units, exps):
+            unit_idx = Unit._db_idx.get(unit)
+            if unit_idx is None:
+                raise ValueError(f"Unit {unit} not recognized.")
+            all_units_exps[unit_idx] += exp
+        dims_exps = Unit._dims_exps_from_units_exps(all_units_exps)
+        all_units_exps.flags.writeable = False
+        dims_exps.flags.writeable = False
+        return all_units_exps, dims_exps
 
     def __repr__(self):
         return f"Unit({repr(list(self._all_units_exps))})"
@@ -191,12 +269,23 @@ class Unit:
 
     def __eq__(self, other):
         raise_for_type(other, Unit, "Equality can only be assessed between two Unit objects.")
-        return (self.dimension == other.dimension) and (
-            np.all(
-                np.isclose(
-                    self.conversion_coefficients_to_si,
-                    other.conversion_coefficients_to_si,
-                )
+        # Units are often shared between quantities, e.g. in results of arithmetic operations
+        if other is self:
+            return True
+        # Units with identical exponents are equal; comparing the raw bytes is much cheaper than
+        # comparing the arrays (and only misses the equality of 0.0 and -0.0, which the general
+        # comparison below still catches)
+        if self._all_units_exps.tobytes() == other._all_units_exps.tobytes():
+            return True
+        if not self.dimension == other.dimension:
+            return False
+        # Same as `np.all(np.isclose(...))` with default tolerances, which is much slower for
+        # just two scalars
+        return all(
+            coeff_self == coeff_other
+            or abs(coeff_self - coeff_other) <= 1e-8 + 1e-5 * abs(coeff_other)
+            for coeff_self, coeff_other in zip(
+                self.conversion_coefficients_to_si, other.conversion_coefficients_to_si
             )
         )
 
@@ -205,11 +294,15 @@ class Unit:
         return self._all_units_exps + other._all_units_exps
 
     def __mul__(self, other):
-        return Unit(self.__mul_common__(other))
+        # The dimension of the product is the product of dimensions, and needs no recalculation
+        return Unit._from_exps_and_dim(
+            self.__mul_common__(other), self._dimension * other.dimension
+        )
 
     def __imul__(self, other):
         self._all_units_exps = self.__mul_common__(other)
         self._dimension *= other.dimension
+        self._clear_cached_properties()
         return self
 
     def __truediv_common__(self, other):
@@ -217,38 +310,51 @@ class Unit:
         return self._all_units_exps - other._all_units_exps
 
     def __truediv__(self, other):
-        return Unit(self.__truediv_common__(other))
+        return Unit._from_exps_and_dim(
+            self.__truediv_common__(other), self._dimension / other.dimension
+        )
 
     def __itruediv__(self, other):
         self._all_units_exps = self.__truediv_common__(other)
         self._dimension /= other.dimension
+        self._clear_cached_properties()
         return self
 
     def __rtruediv__(self, other):
         if other != 1:
             raise ValueError("Right-division can only be performed on 1.")
-        return Unit(-self._all_units_exps)
+        return Unit._from_exps_and_dim(-self._all_units_exps, self._dimension**-1)
 
     def __pow_common__(self, power):
         raise_for_type(power, (int, float), "Exponentiation is only defined for a number.")
         return self._all_units_exps * power
 
     def __pow__(self, power):
-        return Unit(self.__pow_common__(power))
+        return Unit._from_exps_and_dim(self.__pow_common__(power), self._dimension**power)
 
     def __ipow__(self, power):
         self._all_units_exps = self.__pow_common__(power)
         self._dimension **= power
+        self._clear_cached_properties()
         return self
 
+    def _clear_cached_properties(self) -> None:
+        """
+        Remove the cached values of all cached properties, which are pure functions of the
+        unit's exponents. This must be called on initialization, and after the exponents are
+        changed in place.
+        """
+        self._equiv_unit_si = None
+        self._equiv_unit_si_primary = None
+        self._conversion_coefficients_to_si = None
+
     @property
     def name_as_is(self) -> str:
         """
         Name representation of the current unit, with not simplification applied.
         """
-        names_ordered, exps_ordered = order_for_repr(
-            [self._db_names, self._all_units_exps], self._prim_unit_count
-        )
+        order = self._db_repr_order
+        names_ordered, exps_ordered = self._db_names[order], self._all_units_exps[order]
         return gen_symbol(names_ordered, exps_ordered, " . ").replace("empty", "unitless")
 
     @property
@@ -256,23 +362,22 @@ class Unit:
         """
         Name representation of the equivalent SI unit of the current unit.
         """
-        return self.equiv_unit_si.name_as_is
+        return self._cached_equiv_unit_si.name_as_is
 
     @property
     def name_si_primary(self) -> str:
         """
         Name representation of the equivalent primary SI unit of the current unit.
         """
-        return self.equiv_unit_si_primary.name_as_is
+        return self._cached_equiv_unit_si_primary.name_as_is
 
     @property
     def symbol_as_is(self) -> str:
         """
         Symbol representation of the current unit, with not simplification applied.
         """
-        symbols_ordered, exps_ordered = order_for_repr(
-            [self._db_symbols, self._all_units_exps], self._prim_unit_count
-        )
+        order = self._db_repr_order
+        symbols_ordered, exps_ordered = self._db_symbols[order], self._all_units_exps[order]
         return gen_symbol(symbols_ordered, exps_ordered, ".").replace("empty", "1")
 
     @property
@@ -280,14 +385,14 @@ class Unit:
         """
         Symbol representation of the equivalent SI unit of the current unit.
         """
-        return self.equiv_unit_si.symbol_as_is
+        return self._cached_equiv_unit_si.symbol_as_is
 
     @property
     def symbol_si_primary(self) -> str:
         """
         Symbol representation of the equivalent primary SI unit of the current unit.
         """
-        return self.equiv_unit_si_primary.symbol_as_is
+        return self._cached_equiv_unit_si_primary.symbol_as_is
 
     @property
     def exponents_as_is(self) -> np.ndarray:
@@ -302,18 +407,22 @@ class Unit:
         """
         Array of exponents for each constituting unit of the SI unit equivalent for
         the current unit. The order of units is the same as returned by
-        `Unit.supported_input_units()`.
+        `Unit.supported_input_units()`. The array is cached, and is thus returned as read-only.
         """
-        return self.equiv_unit_si.exponents_as_is
+        exps = self._cached_equiv_unit_si._all_units_exps.copy()
+        exps.flags.writeable = False
+        return exps
 
     @property
     def exponents_si_primary(self) -> np.ndarray:
         """
         Array of exponents for each constituting unit of the SI primary unit equivalent
         for the current unit. The order of units is the same as returned by
-        `Unit.supported_input_units()`.
+        `Unit.supported_input_units()`. The array is cached, and is thus returned as read-only.
         """
-        return self.equiv_unit_si_primary.exponents_as_is
+        exps = self._cached_equiv_unit_si_primary._all_units_exps.copy()
+        exps.flags.writeable = False
+        return exps
 
     @property
     def dimension(self) -> Dimension:
@@ -327,7 +436,9 @@ class Unit:
         """
         Whether the unit is an SI unit.
         """
-        return np.all(self._all_units_exps == self.equiv_unit_si._all_units_exps)
+        # This is the case when none of the non-SI units is present,
+        # so there is no need to calculate the equivalent SI unit itself
+        return not self._all_units_exps[self._db_non_si_units_idx].any()
 
     @property
     def equiv_unit_si(self) -> Unit:
@@ -335,11 +446,32 @@ class Unit:
         Unit object representing the equivalent SI unit of the current unit,
         without calculating any conversion coefficients.
         """
-        # Initialize empty array for storing the exponents of SI unit
-        new_all_units_exps = np.zeros_like(self._all_units_exps)
+        # A copy is returned, so that modifying it can't change the cached object
+        return self._cached_equiv_unit_si._copy()
+
+    @property
+    def _cached_equiv_unit_si(self) -> Unit:
+        """
+        Cached value of `equiv_unit_si`, used by the representations of the SI unit.
+        The object is shared, and thus must not be modified in-place.
+        """
+        if self._equiv_unit_si is None:
+            self._equiv_unit_si = self._calculate_equiv_unit_si()
+        return self._equiv_unit_si
+
+    def _calculate_equiv_unit_si(self) -> Unit:
+        """
+        Base function used by `equiv_unit_si`, which calculates its value.
+        """
         # Add the exponents of all units to the indices corresponding to SI units
-        np.add.at(new_all_units_exps, self._db_si_units_idx_all, self._all_units_exps)
-        return Unit(new_all_units_exps)
+        new_all_units_exps = np.bincount(
+            self._db_si_units_idx_all,
+            weights=self._all_units_exps,
+            minlength=self._all_units_exps.size,
+        )
+        # Each unit is replaced by the SI unit of the same dimension, so the dimension is unchanged
+        dimension = Dimension._from_exps(self._dimension._all_dims_exps.copy())
+        return Unit._from_exps_and_dim(new_all_units_exps, dimension)
 
     @property
     def equiv_unit_si_primary(self) -> Unit:
@@ -347,11 +479,31 @@ class Unit:
         Unit object representing the equivalent primary SI unit of the current unit,
         without calculating any conversion coefficients.
         """
+        # A copy is returned, so that modifying it can't change the cached object
+        return self._cached_equiv_unit_si_primary._copy()
+
+    @property
+    def _cached_equiv_unit_si_primary(self) -> Unit:
+        """
+        Cached value of `equiv_unit_si_primary`, used by the representations of the primary SI unit.
+        The object is shared, and thus must not be modified in-place.
+        """
+        if self._equiv_unit_si_primary is None:
+            self._equiv_unit_si_primary = self._calculate_equiv_unit_si_primary()
+        return self._equiv_unit_si_primary
+
+    def _calculate_equiv_unit_si_primary(self) -> Unit:
+        """
+        Base function used by `equiv_unit_si_primary`, which calculates its value.
+        """
+        prim_decomposition = self._dimension._cached_equiv_dim_primary_decomposition
         new_all_units_exps = np.zeros_like(self._all_units_exps)
-        new_all_units_exps[
-            self._db_si_units_idx[: self.dimension._prim_dim_count]
-        ] = self.dimension.exponents_primary_decomposition
-        return Unit(new_all_units_exps)
+        new_all_units_exps[self._db_si_units_idx[: Dimension._prim_dim_count]] = (
+            prim_decomposition._all_dims_exps[: Dimension._prim_dim_count]
+        )
+        # The dimension of the primary SI unit is the primary dimension decomposition
+        dimension = Dimension._from_exps(prim_decomposition._all_dims_exps.copy())
+        return Unit._from_exps_and_dim(new_all_units_exps, dimension)
 
     @property
     def conversion_coefficients_to_si(self) -> Tuple[float, float]:
@@ -365,27 +517,40 @@ class Unit:
         -------
         (conv_shift, conv_factor) : tuple[float, float]
         """
+        if self._conversion_coefficients_to_si is None:
+            self._conversion_coefficients_to_si = self._calculate_conversion_coefficients_to_si()
+        return self._conversion_coefficients_to_si
+
+    def _calculate_conversion_coefficients_to_si(self) -> Tuple[float, float]:
+        """
+        Base function used by `conversion_coefficients_to_si`, which calculates its value.
+        """
+        # Use the compiled kernel of the same calculation when Numba is available
+        if conversion_coefficients_kernel is not None:
+            conv_shift, conv_factor = conversion_coefficients_kernel(
+                self._all_units_exps,
+                self._db_temp_units_idx,
+                self._db_temp_conv_shifts,
+                self._db_non_temp_units_idx,
+                self._db_non_temp_conv_factors,
+            )
+            return np.float64(conv_shift), np.float64(conv_factor)
         # Calculate conversion shift
-        # Temperature units are the only units with conversion shifts rather than conversion factors;
-        # these are found from their dimension and noted to calculate the conversion shift
-        temp_bool_mask = self._db_dim_names == "temperature"
-        temp_units_idx = np.argwhere(temp_bool_mask).flatten()
-        temp_unit_exps = self._all_units_exps[temp_units_idx]
-        temp_unit_conv_shift = self._db_conv_factors[temp_units_idx]
+        # Temperature units are the only units with conversion shifts rather than conversion factors.
         # Here we are only handling Celsius and Kelvin. Since the change in temperature
         # in Kelvin is equal to that of Celsius, having a temperature unit in the denominator
         # means that there is no conversion shift, i.e. 1/K = 1/°C.
         # Thus we are only interested in temperature units with positive exponents
-        positive_temp_unit_exps_idx = np.argwhere(temp_unit_exps > 0)
-        positive_temp_unit_exps = temp_unit_exps[positive_temp_unit_exps_idx]
-        positive_temp_unit_conv_factors = temp_unit_conv_shift[positive_temp_unit_exps_idx]
-        conv_shift = (positive_temp_unit_exps * positive_temp_unit_conv_factors).sum()
-        # Calculate conversion factor for all other non-temperature units
-        non_temp_units_mask = np.logical_not(temp_bool_mask)
-        list_conv_factor = (
-            self._db_conv_factors[non_temp_units_mask] ** self._all_units_exps[non_temp_units_mask]
-        )
-        conv_factor = list_conv_factor[list_conv_factor != 0].prod()
+        temp_unit_exps = self._all_units_exps[self._db_temp_units_idx]
+        is_positive = temp_unit_exps > 0
+        conv_shift = (temp_unit_exps[is_positive] * self._db_temp_conv_shifts[is_positive]).sum()
+        # Calculate conversion factor for all other non-temperature units;
+        # units with a zero exponent have a factor of 1, and are thus skipped.
+        non_temp_unit_exps = self._all_units_exps[self._db_non_temp_units_idx]
+        is_nonzero = non_temp_unit_exps != 0
+        conv_factor = (
+            self._db_non_temp_conv_factors[is_nonzero] ** non_temp_unit_exps[is_nonzero]
+        ).prod()
         return conv_shift, conv_factor
 
     def conversion_coefficients_to(self, unit: Union[str, Unit]) -> Tuple[float, float]:
@@ -410,15 +575,76 @@ class Unit:
             pass
         else:
             raise ValueError("`unit` should either be a string or a Unit object.")
+        return self._conversion_coefficients_between(
+            self._all_units_exps.tobytes(), unit._all_units_exps.tobytes()
+        )
+
+    def conversion_coefficients_to_many(
+        self, units: Sequence[Union[str, Unit]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Conversion shifts and conversion factors needed to transform the unit into each of
+        several given units; see `conversion_coefficients_to`.
+        The conversion coefficients of the current unit into SI are only calculated once,
+        so that only those of the target units are calculated for each element.
+
+        Parameters
+        ----------
+        units : Sequence[Union[str, Unit]]
+            The target units to convert into.
+
+        Returns
+        -------
+        (conversion shifts, conversion factors): tuple[numpy.ndarray, numpy.ndarray]
+            Two 1D-arrays with the same length as `units`, where each element corresponds
+            to the target unit at the same index.
+        """
+        conv_shift_self, conv_factor_self = self.conversion_coefficients_to_si
+        conv_shifts = np.empty(len(units))
+        conv_factors = np.empty(len(units))
+        for idx, unit in enumerate(units):
+            if isinstance(unit, str):
+                unit = Unit(unit)
+            elif not isinstance(unit, Unit):
+                raise ValueError(
+                    "Each element of `units` should either be a string or a Unit object."
+                )
+            # Same calculation as in `_conversion_coefficients_between`
+            is_convertible, n_factor = self._dimension.is_convertible_to(
+                unit._dimension, return_n_factor=True
+            )
+            if not is_convertible:
+                raise ValueError(
+                    "The current unit's dimension does not match with the target unit."
+                )
+            conv_factor_molar = conv_factor_self * phys_const.avogadro_const ** -n_factor
+            conv_shift_other, conv_factor_other = unit.conversion_coefficients_to_si
+            conv_shifts[idx] = conv_shift_self - conv_shift_other
+            conv_factors[idx] = conv_factor_molar / conv_factor_other
+        return conv_shifts, conv_factors
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _conversion_coefficients_between(
+        units_exps_from: bytes, units_exps_to: bytes
+    ) -> Tuple[float, float]:
+        """
+        Base function used by `conversion_coefficients_to`, which calculates the conversion
+        coefficients between two units, given the raw bytes of their `_all_units_exps` arrays.
+        Since the coefficients only depend on the exponents of the two units, the results are
+        cached, so that repeated conversions between the same pair of units are only calculated once.
+        """
+        unit_from = Unit(np.frombuffer(units_exps_from))
+        unit_to = Unit(np.frombuffer(units_exps_to))
         # Check whether the current unit can be converted into the target unit.
         # see `is_convertible_to` for more info.
-        is_convertible, n_factor = self.is_convertible_to(unit, return_n_factor=True)
+        is_convertible, n_factor = unit_from.is_convertible_to(unit_to, return_n_factor=True)
         if not is_convertible:
             raise ValueError("The current unit's dimension does not match with the target unit.")
         else:
-            conv_shift_self, conv_factor_self = self.conversion_coefficients_to_si
-            conv_factor_self *= phys_consts["avogadro_const"]["value"] ** -n_factor
-            conv_shift_other, conv_factor_other = unit.conversion_coefficients_to_si
+            conv_shift_self, conv_factor_self = unit_from.conversion_coefficients_to_si
+            conv_factor_self *= phys_const.avogadro_const ** -n_factor
+            conv_shift_other, conv_factor_other = unit_to.conversion_coefficients_to_si
             conv_shift_total = conv_shift_self - conv_shift_other
             conv_factor_total = conv_factor_self / conv_factor_other
         return conv_shift_total, conv_factor_total
@@ -465,12 +691,10 @@ class Unit:
         -------
         (conversion shift, conversion factor, target unit): tuple[float, float, Unit]
         """
-        conv_shit, conv_factor = self.conversion_coefficients_to(unit)
-        if isinstance(unit, str):
-            converted_unit = Unit(unit)
-        else:
-            converted_unit = unit
-        return conv_shit, conv_factor, converted_unit
+        # Parse a string only once; `conversion_coefficients_to` then uses the same object
+        converted_unit = Unit(unit) if isinstance(unit, str) else unit
+        conv_shift, conv_factor = self.conversion_coefficients_to(converted_unit)
+        return conv_shift, conv_factor, converted_unit
 
     def is_convertible_to(
         self, unit: Union[str, Unit], return_n_factor=False
@@ -525,7 +749,7 @@ class Unit:
             Union[Unit, None]
             Depending on the value of `inplace`.
         """
-        nonzero_nontemp_exps_mask = self._all_units_exps != 0 * self._db_dim_names != "temperature"
+        nonzero_nontemp_exps_mask = (self._all_units_exps != 0) & self._db_non_temp_units_mask
         no_prefix_mask = self._db_prefix_exp == 0
         raise NotImplementedError("Method `modify_prefix` is not yet implemented.")
         return
@@ -565,11 +789,12 @@ class PredefinedUnits:
     that unit, each time it is called.
     """
 
-    @property
+    # The containers hold no state of their own, and can thus be cached
+    @cached_property
     def primary(self):
         return PredefinedUnitsCategory(primary)
 
-    @property
+    @cached_property
     def derived(self):
         return PredefinedUnitsCategory(derived)
 
@@ -578,33 +803,56 @@ class PredefinedUnitsCategory:
     """
     Container class for all available known primary or derived units.
     Units are divided into different dimensions.
-    Each available unit is defined as a property in
-    this class, which returns a new Unit object for
-    that unit, each time it is called.
+    Each available dimension is an attribute of this class, which returns
+    a container of the units of that dimension; see `PredefinedUnitsInDim`.
+    Containers are only created when their dimension is first accessed.
     """
 
     def __init__(self, unit_category_dict):
-        def dim_gen(dim_units_dict):
-            return PredefinedUnitsInDim(dim_units_dict)
-
-        for dim_name, data in unit_category_dict.items():
-            property(setattr(self, dim_name, dim_gen(dim_units_dict=data)))
+        # Only the symbols are needed to create the units
+        self._units_symbols = {
+            dim_name: {unit_name: unit["symbol"] for unit_name, unit in data["units"].items()}
+            for dim_name, data in unit_category_dict.items()
+        }
+
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails, i.e. on the first access of a dimension
+        try:
+            units_symbols = self.__dict__["_units_symbols"][name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        # The container holds no state of its own, and can thus be cached
+        units_in_dim = PredefinedUnitsInDim(units_symbols)
+        setattr(self, name, units_in_dim)
+        return units_in_dim
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self._units_symbols)
 
 
 class PredefinedUnitsInDim:
     """
     Container class for all available known units of specific dimension.
-    Each available unit is defined as a property in
-    this class, which returns a new Unit object for
-    that unit, each time it is called.
+    Each available unit is an attribute of this class, which returns a new
+    Unit object for that unit, each time it is called.
     """
 
-    def __init__(self, dim_units_dict):
-        def unit_gen(unit_symbol):
-            return Unit(unit_symbol)
+    def __init__(self, units_symbols):
+        self._units_symbols = units_symbols
+
+    def __getattr__(self, name):
+        try:
+            unit_symbol = self.__dict__["_units_symbols"][name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        return Unit(unit_symbol)
 
-        for unit_name, data in dim_units_dict["units"].items():
-            property(setattr(self, unit_name, unit_gen(data["symbol"])))
+    def __dir__(self):
+        return list(super().__dir__()) + list(self._units_symbols)
 
 
 # Instantiate the container class,
@@ -1,6 +1,105 @@
+import numpy as np
+import pytest
+
 from duq.dimension import Dimension
 
 
 def test_equality():
     assert Dimension("F") == Dimension("M.L.T^-2")
     assert Dimension("E") == Dimension("M.L^2.T^-2")
+
+
+def test_construction_from_names_and_symbols():
+    assert np.array_equal(
+        Dimension("mass.length^2.T^-2").exponents_as_is,
+        Dimension("M.L^2.T^-2").exponents_as_is,
+    )
+    assert np.array_equal(
+        Dimension("L.L").exponents_as_is, Dimension("L^2").exponents_as_is
+    )
+    with pytest.raises(ValueError):
+        Dimension("M.X")
+
+
+def test_inplace_operations_update_representations():
+    dim = Dimension("L")
+    assert dim.symbol_as_is == "L"
+    assert dim == Dimension("L")
+    dim *= Dimension("M")
+    dim /= Dimension("T^2")
+    assert dim.symbol_as_is == "MLT⁻²"
+    assert dim.symbol_shortest_composition == "F"
+    dim **= 2
+    assert dim == Dimension("F^2")
+
+
+def test_shortest_composition_kernel_matches_numpy(monkeypatch):
+    import duq.dimension
+
+    if duq.dimension.shortest_composition_kernel is None:
+        pytest.skip("Numba is not installed.")
+    dims = ["E", "E.N^-1", "P.Vol", "M.L^-1.T^-2.Θ^-1", "Q.V^2", "L^3/2"]
+    with_kernel = [Dimension(dim).equiv_dim_shortest_composition for dim in dims]
+    monkeypatch.setattr(duq.dimension, "shortest_composition_kernel", None)
+    for dim, result in zip(dims, with_kernel):
+        expected = Dimension(dim).equiv_dim_shortest_composition
+        assert np.array_equal(result.exponents_as_is, expected.exponents_as_is)
+
+
+def test_equiv_dim_all():
+    equiv_dims = Dimension("F").equiv_dim_all()
+    assert all(dim == Dimension("F") for dim in equiv_dims)
+    assert any(
+        np.array_equal(dim.exponents_as_is, Dimension("E.L^-1").exponents_as_is)
+        for dim in equiv_dims
+    )
+    # Solutions that are integers only up to floating-point rounding errors are also included
+    assert any(
+        np.array_equal(dim.exponents_as_is, Dimension("ν^-2.ρ^-1.P^2").exponents_as_is)
+        for dim in equiv_dims
+    )
+    assert not any(
+        np.array_equal(dim.exponents_as_is, Dimension("F").exponents_as_is)
+        for dim in equiv_dims
+    )
+
+
+def test_predefined_dimensions_are_independent():
+    from duq.dimension import predefined
+
+    force = predefined.force
+    assert force == Dimension("F")
+    force *= Dimension("L")
+    assert predefined.force == Dimension("F")
+
+
+def test_is_convertible_to():
+    assert Dimension("E").is_convertible_to("M.L^2.T^-2")
+    is_convertible, n_factor = Dimension("E").is_convertible_to(
+        "E.N^-1", return_n_factor=True
+    )
+    assert is_convertible and n_factor == -1
+    assert not Dimension("E").is_convertible_to("F")
+
+
+def test_cached_prim_dim_decomposition_is_read_only():
+    dim = Dimension("F")
+    with pytest.raises(ValueError):
+        dim.exponents_primary_decomposition[0] = 5
+    assert dim == Dimension("M.L.T^-2")
+    assert dim.symbol_primary_decomposition == Dimension("M.L.T^-2").symbol_as_is
+
+
+def test_cached_equiv_dims_are_not_shared():
+    dim = Dimension("F")
+    with pytest.raises(ValueError):
+        dim.exponents_shortest_composition[:] = 0
+    shortest = dim.equiv_dim_shortest_composition
+    shortest **= 2
+    primary = dim.equiv_dim_primary_decomposition
+    primary *= Dimension("T")
+    assert dim.symbol_shortest_composition == "F"
+    assert dim.symbol_primary_decomposition == Dimension("M.L.T^-2").symbol_as_is
+    assert np.array_equal(
+        dim.exponents_shortest_composition, Dimension("F").exponents_as_is
+    )
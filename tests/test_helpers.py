@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from duq.helpers import (
+    indices_for_repr,
+    order_for_repr,
+    parse_base_with_exp_string,
+    pretty_print_base_with_exp_series,
+)
+
+
+def test_order_for_repr():
+    assert indices_for_repr(6, 3).tolist() == [5, 4, 3, 0, 1, 2]
+    (ordered,) = order_for_repr([np.array(list("abcdef"))], 3)
+    assert ordered.tolist() == list("fedabc")
+
+
+def test_pretty_print_base_with_exp_series():
+    assert pretty_print_base_with_exp_series(["L", "M", "T"], [1, 2, -2]) == "LM²T⁻²"
+    assert (
+        pretty_print_base_with_exp_series(["length", "mass", "time"], [1, 2, -2], ".")
+        == "length.mass².time⁻²"
+    )
+    assert pretty_print_base_with_exp_series(["m.s^-1", "kg"], [2, 1]) == "(m.s⁻¹)²kg"
+    assert pretty_print_base_with_exp_series([], []) == "empty"
+    assert (
+        pretty_print_base_with_exp_series(["L", "M"], [2, -1], nested_bases=False)
+        == "L²M⁻¹"
+    )
+
+
+def test_parse_base_with_exp_string():
+    bases, exps = parse_base_with_exp_string("kg.m^2.s^-2.mol^-3/2")
+    assert bases == ("kg", "m", "s", "mol")
+    assert exps == (1, 2, -2, -1.5)
+    bases, exps = parse_base_with_exp_string("M..L")
+    assert bases == ("M", "", "L")
+    with pytest.raises(ValueError):
+        parse_base_with_exp_string("L^2^3")
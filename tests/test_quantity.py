@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from duq.quantity import Quantity, predefined
+from duq.unit import Unit
+from duq.data.physical_constants import phys_consts
+from duq.data.dimensions_units import derived
+
+
+def test_defining_constants_match_codata():
+    # Exact values of the defining constants of the SI (CODATA 2018)
+    codata = {
+        "avogadro_const": 6.02214076e23,
+        "boltzmann_const": 1.380649e-23,
+        "planck_const": 6.62607015e-34,
+        "elementary_charge": 1.602176634e-19,
+        "speed_of_light": 299792458,
+    }
+    for name, value in codata.items():
+        assert phys_consts[name]["value"] == value
+    # Constants that are also defined as units must have the same value
+    assert (
+        derived["electric_charge"]["units"]["elementary_charge"]["conv_factor"]
+        == phys_consts["elementary_charge"]["value"]
+    )
+    assert (
+        derived["energy"]["units"]["electronvolt"]["conv_factor"]
+        == phys_consts["elementary_charge"]["value"]
+    )
+
+
+def test_predefined_constants():
+    assert predefined.boltzmann_const == Quantity(1.380649e-23, "J.K^-1")
+    assert np.isclose(predefined.boltzmann_const.value, 1.380649e-23)
+
+
+def test_predefined_constants_do_not_share_units():
+    unit = predefined.speed_of_light.unit
+    unit *= Unit("s")
+    assert predefined.speed_of_light.unit == Unit("m.s^-1")
+    assert predefined.speed_of_light.unit.symbol_as_is == "m.s⁻¹"
+
+
+def test_phys_const_named_tuple():
+    from duq.data.physical_constants import phys_const
+
+    assert phys_const.avogadro_const == phys_consts["avogadro_const"]["value"]
+    assert phys_const._fields == tuple(phys_consts.keys())
+
+
+def test_addition_in_equal_units_keeps_int_values():
+    total = Quantity(1, "m") + Quantity(2, "m")
+    assert type(total.value) is int and total.value == 3
+    assert type((Quantity(5, "J") - Quantity(2, "kg.m^2.s^-2")).value) is int
+
+
+def test_approximately_equal_units_are_converted():
+    # Equal to a metre within the tolerance of `Unit.__eq__`, but not exactly
+    unit = "m^9999999/10000000.nm^1/10000000"
+    assert Unit(unit) == Unit("m")
+    difference = (Quantity(1.0, "m") - Quantity(1.0, unit)).value
+    assert difference != 0 and np.isclose(difference, 1 - 1e-9**1e-7, rtol=1e-6)
+
+
+def test_addition_and_comparison_across_units():
+    assert np.isclose((Quantity(1, "m") + Quantity(50, "cm")).value, 1.5)
+    assert Quantity(1, "m") > Quantity(50, "cm")
+    assert Quantity(1, "m") == Quantity(100, "cm")
+    with pytest.raises(ValueError):
+        Quantity(1, "m") + Quantity(1, "s")
+
+
+def test_quantity_has_no_instance_dict():
+    quantity = Quantity(1, "m") * Quantity(2, "s")
+    assert not hasattr(quantity, "__dict__")
+    with pytest.raises(AttributeError):
+        quantity.some_attribute = 1
+
+
+def test_array_value_dtypes():
+    assert Quantity(np.array([1, 2], dtype=np.uint8), "m").value.dtype == np.uint8
+    with pytest.raises(ValueError):
+        Quantity(np.array([True, False]), "m")
+
+
+def test_array_valued_quantity():
+    lengths = Quantity.from_array([1.0, 2.5, 300], "m")
+    assert np.allclose((lengths + Quantity(50, "cm")).value, [1.5, 3, 300.5])
+    assert np.allclose(lengths.convert_unit("cm").value, [100, 250, 30000])
+    assert np.all(lengths == Quantity.from_array([100, 250, 30000], "cm"))
+    assert lengths.str_repr_short == "[1E+00, 2.5E+00, 3E+02] m"
+    with pytest.raises(ValueError):
+        lengths.normalize()
+
+
+def test_affine_transform_kernel_matches_numpy(monkeypatch):
+    import duq.quantity
+
+    if duq.quantity.affine_transform_kernel is None:
+        pytest.skip("Numba is not installed.")
+    monkeypatch.setattr(Quantity, "_kernel_min_size", 1)
+    temperatures = Quantity.from_array(np.linspace(-50, 50, 101).reshape(1, 101), "°C")
+    with_kernel = temperatures.convert_unit("K").value
+    monkeypatch.setattr(duq.quantity, "affine_transform_kernel", None)
+    assert np.array_equal(with_kernel, temperatures.convert_unit("K").value)
+
+
+def test_converted_unit_is_not_shared_with_source():
+    quantity = Quantity(1.0, "kcal")
+    unit = quantity.convert_unit_to_si().unit
+    unit *= Unit("m")
+    assert quantity.convert_unit_to_si().unit == Unit("J")
+    assert quantity.unit.symbol_si == "J"
+
+
+def test_physical_constants_data_is_read_only():
+    from duq.data.physical_constants import phys_const
+
+    with pytest.raises(TypeError):
+        phys_consts["avogadro_const"]["value"] = 1
+    assert phys_const.avogadro_const == phys_consts["avogadro_const"]["value"]
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+
+from duq.unit import Unit
+
+
+def test_conversion_coefficients_to():
+    assert np.allclose(Unit("kcal").conversion_coefficients_to("J"), (0, 4184))
+    assert np.allclose(Unit("°C").conversion_coefficients_to("K"), (273.15, 1))
+    assert np.allclose(Unit("nm").conversion_coefficients_to(Unit("Å")), (0, 10))
+    # Repeated conversion between the same pair of units
+    assert np.allclose(Unit("nm").conversion_coefficients_to(Unit("Å")), (0, 10))
+
+
+def test_conversion_coefficients_to_many():
+    conv_shifts, conv_factors = Unit("°C").conversion_coefficients_to_many(
+        ["K", Unit("°C"), "K"]
+    )
+    assert np.allclose(conv_shifts, [273.15, 0, 273.15])
+    assert np.allclose(conv_factors, [1, 1, 1])
+    with pytest.raises(ValueError):
+        Unit("m").conversion_coefficients_to_many(["s"])
+
+
+def test_prefix_exp_of_prefixed_units():
+    from duq.data.dimensions_units import primary
+
+    assert primary["length"]["units"]["nanometre"]["prefix_exp"] == -9
+    assert primary["time"]["units"]["femtosecond"]["prefix_exp"] == -15
+
+
+def test_micro_prefix_symbol():
+    from duq.data.metric_prefixes import micro
+
+    assert micro["symbol"] == "μ"
+    assert Unit("μm") == Unit("micrometre")
+
+
+def test_unit_lookup_by_symbol_and_name():
+    from duq.data.dimensions_units import unit_by_symbol, unit_by_name
+
+    dim_name, unit_key, unit = unit_by_symbol["kg"]
+    assert (dim_name, unit_key, unit["name"]) == ("mass", "kilogram", "kilogram")
+    assert unit_by_name["degree Celsius"][:2] == ("temperature", "celsius")
+    assert unit_by_symbol["nm"][2] is unit_by_name["nanometre"][2]
+
+
+def test_unit_data_is_read_only():
+    from duq.data.dimensions_units import primary, unit_tuples
+
+    with pytest.raises(TypeError):
+        primary["mass"]["units"]["gram"]["conv_factor"] = 1
+    with pytest.raises(ValueError):
+        primary["mass"]["prim_dim_exps"][0] = 2
+    assert unit_tuples["gram"].conv_factor == 1e-3
+    assert hash(unit_tuples["gram"]) == hash(unit_tuples["gram"])
+
+
+def test_unit_data_prim_dim_exps():
+    from duq.data.dimensions_units import derived
+
+    density = derived["density"]
+    unit_prim_dim_exps = density["units"]["kilogram_per_cubic_metre"]["prim_dim_exps"]
+    assert unit_prim_dim_exps.tolist() == [1, -3, 0, 0, 0, 0, 0]
+    assert unit_prim_dim_exps.base is density["prim_dim_exps"].base
+
+
+def test_units_from_same_string_are_independent():
+    unit1 = Unit("kg.m^2.s^-2")
+    unit2 = Unit("kg.m^2.s^-2")
+    assert unit1 == unit2
+    assert unit1.dimension == Unit(list(unit1._all_units_exps)).dimension
+    unit1 *= Unit("m")
+    assert unit1.dimension != unit2.dimension
+    assert unit2 == Unit("J")
+
+
+def test_conversion_coefficients_kernel_matches_numpy(monkeypatch):
+    import duq.unit
+
+    if duq.unit.conversion_coefficients_kernel is None:
+        pytest.skip("Numba is not installed.")
+    units = ["kcal.mol^-1", "°C", "°C^-1.J", "nm^3/2.fs^-2", "kg.m^2.s^-2", "Å.°C^2"]
+    with_kernel = [Unit(unit).conversion_coefficients_to_si for unit in units]
+    monkeypatch.setattr(duq.unit, "conversion_coefficients_kernel", None)
+    for unit, result in zip(units, with_kernel):
+        assert np.allclose(
+            result, Unit(unit).conversion_coefficients_to_si, rtol=1e-14, atol=0
+        )
+
+
+def test_inplace_ops_update_equiv_si_units():
+    unit = Unit("kcal")
+    assert unit.equiv_unit_si == Unit("J")
+    assert unit.equiv_unit_si_primary == Unit("kg.m^2.s^-2")
+    unit /= Unit("mol")
+    assert unit.equiv_unit_si == Unit("J.mol^-1")
+    unit **= 2
+    assert unit.symbol_si == Unit("J^2.mol^-2").symbol_as_is
+    unit *= Unit("mol^2")
+    assert unit.equiv_unit_si_primary == Unit("kg^2.m^4.s^-4")
+
+
+def test_modifying_si_units_does_not_change_source():
+    unit = Unit("kcal")
+    si_unit = unit.convert_to_si[2]
+    si_unit *= Unit("m")
+    si_unit_primary = unit.equiv_unit_si_primary
+    si_unit_primary **= 2
+    assert unit.symbol_si == "J"
+    assert unit.symbol_si_primary == Unit("kg.m^2.s^-2").symbol_as_is
+    with pytest.raises(ValueError):
+        unit.exponents_si[:] = 0
+    assert unit.symbol_si == "J"
+
+
+def test_equality():
+    assert Unit("kcal.mol^-1") == Unit("kcal.mol^-1")
+    assert Unit("J") == Unit("kg.m^2.s^-2")
+    assert not Unit("J") == Unit("kcal")
+    unit = Unit("m")
+    unit **= 2
+    assert unit == Unit("m^2")
+
+
+def test_predefined_units():
+    from duq.unit import predefined
+
+    assert predefined.primary.length.metre == Unit("m")
+    assert predefined.derived.energy.joule == Unit("J")
+    assert predefined.primary.length.metre is not predefined.primary.length.metre
+    assert "metre" in dir(predefined.primary.length)
+    with pytest.raises(AttributeError):
+        predefined.primary.length.not_a_unit
+
+
+def test_modify_prefix_is_not_implemented():
+    with pytest.raises(NotImplementedError):
+        Unit("g").modify_prefix(3)
+
+
+def test_unit_has_no_instance_dict():
+    unit = Unit("m") * Unit("s")
+    assert not hasattr(unit, "__dict__")
+    with pytest.raises(AttributeError):
+        unit.some_attribute = 1
+
+
+def test_metric_prefixes_are_read_only():
+    from duq.data.metric_prefixes import micro, prefixes
+
+    with pytest.raises(TypeError):
+        micro["factor"] = 1
+    assert micro is prefixes["micro"]